@@ -346,7 +346,7 @@ async def interview_agent(ctx: agents.JobContext):
                         skill_assessments=turn_scores,
                         difficulty_level=difficulty_state.level.value,
                         competency_scores=final_competencies,
-                        topics_covered=list(candidate_profile.topics_covered)
+                        topics_covered=list(candidate_profile.topics_sorted)
                     )
                 )
                 await db.commit()
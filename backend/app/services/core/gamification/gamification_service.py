@@ -10,6 +10,7 @@ Handles all write operations for the RPG layer:
 """
 import logging
 import math
+from datetime import date, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +20,67 @@ from app.services.core.gamification.career_manager import career_manager
 
 logger = logging.getLogger("gamification-service")
 
+
+def compute_new_streak(last_active: Optional[date], today: date, current: int) -> int:
+    """Daily streak after activity today, given the last active date and current streak."""
+    if last_active == today:
+        return current  # Already active today, streak unchanged
+    if last_active == today - timedelta(days=1):
+        return current + 1
+    # Streak broken (or first activity)
+    return 1
+
+
+# Developer-First radar chart axes
+SKILL_STAT_KEYS = ("coding_standards", "system_design", "algorithms", "communication", "tech_proficiency", "debugging")
+
+
+def update_skill_stats(current: Dict[str, int], metrics: Dict[str, int], alpha: float = 0.3) -> Dict[str, int]:
+    """
+    Weighted moving average of radar stats: (1 - alpha) * old + alpha * new.
+    Axes missing from current default to 50; axes missing from metrics keep their old value.
+    """
+    updated = {}
+    for key in SKILL_STAT_KEYS:
+        old_val = current.get(key, 50)
+        new_val = metrics.get(key, old_val)
+        updated[key] = int((1 - alpha) * old_val + alpha * new_val)
+    return updated
+
+
+# Node score that counts towards high_score_count badges
+HIGH_SCORE_THRESHOLD = 95
+
+
+def count_high_scores(nodes) -> int:
+    """Number of completed nodes scored at or above HIGH_SCORE_THRESHOLD."""
+    return sum(1 for n in nodes if (n.high_score or 0) >= HIGH_SCORE_THRESHOLD)
+
+
+def badge_earned(
+    criteria: Dict,
+    interview_count: int,
+    score: int,
+    level: int,
+    daily_streak: Optional[int],
+    high_score_count: int
+) -> bool:
+    """Whether a badge's criteria are met by the user's current stats."""
+    criteria_type = criteria.get("type")
+    if criteria_type == "interview_count":
+        return interview_count >= criteria.get("min", 1)
+    if criteria_type == "interview_score":
+        return score >= criteria.get("min", 90)
+    if criteria_type == "level":
+        return level >= criteria.get("min", 1)
+    if criteria_type == "daily_streak":
+        return (daily_streak or 0) >= criteria.get("min", 3)
+    if criteria_type == "high_score_count":
+        return high_score_count >= criteria.get("min_count", 3)
+    # interview_duration would need session timing data - skip for now
+    return False
+
+
 class GamificationService:
     
     # --- XP CONSTANTS ---
@@ -131,19 +193,16 @@ class GamificationService:
         progress.current_xp += xp_gain
         
         # 3. Daily Streak Logic
-        from datetime import datetime, timedelta, timezone
+        from datetime import datetime, timezone
         today = datetime.now(timezone.utc).date()
         last_active = progress.last_active_at.date() if progress.last_active_at else None
         
-        if last_active == today:
-            pass  # Already active today, streak unchanged
-        elif last_active == today - timedelta(days=1):
-            progress.daily_streak = (progress.daily_streak or 0) + 1
-            logger.info(f"🔥 User {user_id} streak increased to {progress.daily_streak}")
-        else:
-            # Streak broken (or first activity)
-            progress.daily_streak = 1
-            logger.info(f"🔄 User {user_id} streak reset to 1")
+        if last_active != today:
+            progress.daily_streak = compute_new_streak(last_active, today, progress.daily_streak or 0)
+            if progress.daily_streak > 1:
+                logger.info(f"🔥 User {user_id} streak increased to {progress.daily_streak}")
+            else:
+                logger.info(f"🔄 User {user_id} streak reset to 1")
         
         progress.last_active_at = datetime.now(timezone.utc)
         
@@ -155,19 +214,8 @@ class GamificationService:
         
         # 3. Update Radar Stats (Moving Averge approximation)
         # NewAverage = OldAverage + (NewValue - OldAverage) / N ??
-        # Or just simple weighted: 0.8 * Old + 0.2 * New
-        alpha = 0.3 # Weight of new session
-        current_stats = progress.skill_stats or {}
-        
-        updated_stats = {}
-        # Developer-First Axis
-        for key in ["coding_standards", "system_design", "algorithms", "communication", "tech_proficiency", "debugging"]:
-            old_val = current_stats.get(key, 50)
-            new_val = metrics.get(key, old_val) # Fallback to old if metric missing
-            weighted = int((1 - alpha) * old_val + alpha * new_val)
-            updated_stats[key] = weighted
-            
-        progress.skill_stats = updated_stats
+        # Or just simple weighted: 0.7 * Old + 0.3 * New
+        progress.skill_stats = update_skill_stats(progress.skill_stats or {}, metrics)
         
         # 4. Unlock Children
         unlocked_ids = []
@@ -260,7 +308,7 @@ class GamificationService:
         interview_count = len(completed_nodes)
         
         # Count high scores
-        high_score_count = sum(1 for n in completed_nodes if (n.high_score or 0) >= 95)
+        high_score_count = count_high_scores(completed_nodes)
         
         new_badges = []
         
@@ -268,21 +316,14 @@ class GamificationService:
             if badge.id in owned_badge_ids:
                 continue  # Already has this badge
                 
-            criteria = badge.criteria or {}
-            criteria_type = criteria.get("type")
-            earned = False
-            
-            if criteria_type == "interview_count":
-                earned = interview_count >= criteria.get("min", 1)
-            elif criteria_type == "interview_score":
-                earned = score >= criteria.get("min", 90)
-            elif criteria_type == "level":
-                earned = progress.current_level >= criteria.get("min", 1)
-            elif criteria_type == "daily_streak":
-                earned = (progress.daily_streak or 0) >= criteria.get("min", 3)
-            elif criteria_type == "high_score_count":
-                earned = high_score_count >= criteria.get("min_count", 3)
-            # interview_duration would need session timing data - skip for now
+            earned = badge_earned(
+                badge.criteria or {},
+                interview_count=interview_count,
+                score=score,
+                level=progress.current_level,
+                daily_streak=progress.daily_streak,
+                high_score_count=high_score_count
+            )
             
             if earned:
                 # Award the badge
@@ -7,13 +7,21 @@ Tracks verified skills, identified gaps, red flags, and performance trajectory.
 import json
 import logging
 import time
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional, Set
+from dataclasses import dataclass, field
+from typing import AbstractSet, Dict, Any, FrozenSet, List, Optional, Tuple
 from google import genai
 from config.settings import get_settings
 
 logger = logging.getLogger("candidate-profile")
 
+# Section prefixes for to_context_string
+VERIFIED_SKILLS_HEADER = "VERIFIED SKILLS: "
+GAPS_HEADER = "GAPS TO PROBE: "
+CONCERNS_HEADER = "CONCERNS: "
+STRENGTHS_HEADER = "STRENGTHS: "
+TOPICS_HEADER = "TOPICS COVERED (DO NOT REPEAT): "
+PERFORMANCE_HEADER = "PERFORMANCE: "
+
 
 @dataclass
 class SkillAssessment:
@@ -24,7 +32,7 @@ class SkillAssessment:
     confidence: float  # 0-1
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateProfile:
     """Real-time candidate profile built during interview."""
     # Verified technical and soft skills with depth ratings
@@ -39,8 +47,9 @@ class CandidateProfile:
     # Strengths identified
     strengths: List[str] = field(default_factory=list)
 
-    # Topics already covered (to avoid repetition)
-    topics_covered: Set[str] = field(default_factory=set)
+    # Topics already covered (to avoid repetition); a set while a turn is
+    # being processed, frozen with freeze_topics() once it is done
+    topics_covered: AbstractSet[str] = field(default_factory=set)
 
     # Questions asked with metadata
     questions_asked: List[Dict[str, Any]] = field(default_factory=list)
@@ -54,17 +63,44 @@ class CandidateProfile:
     # Current turn number
     current_turn: int = 0
 
+    # (frozen topics, sorted topics) cached by freeze_topics()
+    _sorted_topics_cache: Optional[Tuple[FrozenSet[str], Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def topics_sorted(self) -> Tuple[str, ...]:
+        """Covered topics in a stable order, cached while the set is frozen."""
+        cache = self._sorted_topics_cache
+        if cache is not None and cache[0] is self.topics_covered:
+            return cache[1]
+        return tuple(sorted(self.topics_covered))
+
+    def add_topic(self, topic: str) -> None:
+        """Record a covered topic, thawing a frozen topic set if needed."""
+        if isinstance(self.topics_covered, frozenset):
+            self.topics_covered = set(self.topics_covered)
+        self.topics_covered.add(topic)
+
+    def freeze_topics(self) -> None:
+        """Freeze the covered topics after a turn and cache their sorted order."""
+        frozen = frozenset(self.topics_covered)
+        self.topics_covered = frozen
+        self._sorted_topics_cache = (frozen, tuple(sorted(frozen)))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Shallow-copy the containers (one level for verified_skills) so the
+        # snapshot is detached from the live profile without a deepcopy
         return {
-            "verified_skills": self.verified_skills,
-            "identified_gaps": self.identified_gaps,
-            "red_flags": self.red_flags,
-            "strengths": self.strengths,
-            "topics_covered": list(self.topics_covered),
-            "questions_asked": self.questions_asked,
-            "performance_trajectory": self.performance_trajectory,
-            "key_facts": self.key_facts,
+            "verified_skills": {skill: dict(data) for skill, data in self.verified_skills.items()},
+            "identified_gaps": list(self.identified_gaps),
+            "red_flags": list(self.red_flags),
+            "strengths": list(self.strengths),
+            "topics_covered": list(self.topics_sorted),
+            "questions_asked": list(self.questions_asked),
+            "performance_trajectory": list(self.performance_trajectory),
+            "key_facts": list(self.key_facts),
             "current_turn": self.current_turn
         }
 
@@ -213,7 +249,8 @@ Return JSON:
 
             # Set initial topics to explore
             for topic in data.get("initial_topics", []):
-                profile.topics_covered.add(f"pending:{topic}")
+                profile.add_topic(f"pending:{topic}")
+            profile.freeze_topics()
 
             logger.info(f"Initial profile created with {len(profile.verified_skills)} claimed skills")
             return profile
@@ -326,7 +363,8 @@ Return JSON:
             # Track topic covered
             topic = data.get("topic_covered", "")
             if topic:
-                profile.topics_covered.add(topic)
+                profile.add_topic(topic)
+                profile.freeze_topics()
 
             logger.debug(f"Profile updated at turn {profile.current_turn}")
             return profile
@@ -337,14 +375,15 @@ Return JSON:
 
     def to_context_string(self, profile: CandidateProfile) -> str:
         """Convert profile to prompt-injectable context string."""
-        if not profile or not any([
-            profile.verified_skills,
-            profile.identified_gaps,
-            profile.strengths
-        ]):
+        # Short-circuit before building anything for an empty profile
+        if not profile or not (
+            profile.verified_skills
+            or profile.identified_gaps
+            or profile.strengths
+        ):
             return ""
 
-        sections = []
+        sections: List[str] = []
 
         # Verified skills
         if profile.verified_skills:
@@ -354,31 +393,30 @@ Return JSON:
                 if data.get("depth", 0) >= 3
             ]
             if verified:
-                sections.append(f"VERIFIED SKILLS: {', '.join(verified)}")
+                sections.append(VERIFIED_SKILLS_HEADER + ", ".join(verified))
 
         # Gaps to probe
         if profile.identified_gaps:
-            sections.append(f"GAPS TO PROBE: {', '.join(profile.identified_gaps[:5])}")
+            sections.append(GAPS_HEADER + ", ".join(profile.identified_gaps[:5]))
 
         # Red flags
         if profile.red_flags:
-            flags = [f["detail"] for f in profile.red_flags[:3]]
-            sections.append(f"CONCERNS: {'; '.join(flags)}")
+            sections.append(CONCERNS_HEADER + "; ".join(f["detail"] for f in profile.red_flags[:3]))
 
         # Strengths
         if profile.strengths:
-            sections.append(f"STRENGTHS: {', '.join(profile.strengths[:3])}")
+            sections.append(STRENGTHS_HEADER + ", ".join(profile.strengths[:3]))
 
         # Topics covered
         if profile.topics_covered:
-            sections.append(f"TOPICS COVERED (DO NOT REPEAT): {', '.join(list(profile.topics_covered)[:10])}")
+            sections.append(TOPICS_HEADER + ", ".join(profile.topics_sorted[:10]))
 
         # Performance trend
         if len(profile.performance_trajectory) >= 3:
             recent = profile.performance_trajectory[-3:]
             avg = sum(recent) / len(recent)
             trend = "improving" if recent[-1] > recent[0] else "declining" if recent[-1] < recent[0] else "stable"
-            sections.append(f"PERFORMANCE: {trend} (avg: {avg:.0f}/100)")
+            sections.append(f"{PERFORMANCE_HEADER}{trend} (avg: {avg:.0f}/100)")
 
         return "\n".join(sections)
 
@@ -6,14 +6,26 @@ Computes role-weighted final scores and rubric-based assessments.
 """
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from config.settings import get_settings
 
 logger = logging.getLogger("competency-evaluator")
 
+# Turn references kept per competency as evidence
+MAX_EVIDENCE = 5
+
+# Weights used when the config has no "default" role entry
+DEFAULT_ROLE_WEIGHTS = {
+    "technical_depth": 0.35,
+    "communication": 0.20,
+    "problem_solving": 0.30,
+    "leadership": 0.15
+}
+
 
 @dataclass
 class CompetencyScore:
@@ -25,6 +37,27 @@ class CompetencyScore:
     sample_size: int  # Number of data points
 
 
+@dataclass(frozen=True, eq=False)
+class RoleWeights(Mapping[str, float]):
+    """Read-only competency -> weight mapping for a role, with its sum precomputed."""
+    weights: Dict[str, float]
+    total: float
+
+    @classmethod
+    def from_weights(cls, weights: Mapping[str, float]) -> "RoleWeights":
+        weights = dict(weights)
+        return cls(weights=weights, total=sum(weights.values()))
+
+    def __getitem__(self, competency: str) -> float:
+        return self.weights[competency]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.weights)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+
 class CompetencyEvaluator:
     """
     Evaluates candidate performance against a competency framework.
@@ -37,6 +70,10 @@ class CompetencyEvaluator:
         self.settings = get_settings()
         self._load_config()
 
+        # Role lookups are pure functions of the loaded config, which is
+        # instance state, so memoize per instance rather than on the class
+        self._role_weights_for = lru_cache(maxsize=256)(self._resolve_role_weights)
+
     def _load_config(self):
         """Load competency configuration from YAML."""
         config_path = self.settings.base_path / "config" / "competencies.yaml"
@@ -54,6 +91,36 @@ class CompetencyEvaluator:
                 "dimension_competency_map": {}
             }
 
+        # Dimension -> competency lookup, resolved once instead of per turn
+        self._dim_map: Dict[str, str] = dict(self.config.get("dimension_competency_map") or {})
+
+        # Role weights keyed by lowercased role, summed once at load time
+        self._role_weights_table: Dict[str, RoleWeights] = {
+            role.lower(): RoleWeights.from_weights(w)
+            for role, w in self.config.get("role_competency_weights", {}).items()
+        }
+        self._default_role_weights = self._role_weights_table.get(
+            "default", RoleWeights.from_weights(DEFAULT_ROLE_WEIGHTS)
+        )
+
+        # Rubric "low-high" keys parsed into (low, high, level) once per competency
+        self._rubric_ranges: Dict[str, List[Tuple[int, int, str]]] = {
+            competency: self._parse_rubric((comp_config or {}).get("rubric") or {})
+            for competency, comp_config in (self.config.get("competencies") or {}).items()
+        }
+
+    @staticmethod
+    def _parse_rubric(rubric: Mapping[str, str]) -> List[Tuple[int, int, str]]:
+        """Parse rubric range keys, skipping malformed ones."""
+        ranges = []
+        for range_str, level in rubric.items():
+            try:
+                low, high = map(int, range_str.split("-"))
+            except ValueError:
+                continue
+            ranges.append((low, high, level))
+        return ranges
+
     def map_dimension_to_competency(self, dimension: str) -> str:
         """
         Map a scoring dimension to its parent competency.
@@ -64,10 +131,9 @@ class CompetencyEvaluator:
         Returns:
             Competency name (e.g., "technical_depth", "communication")
         """
-        dimension_map = self.config.get("dimension_competency_map", {})
-        return dimension_map.get(dimension, "general")
+        return self._dim_map.get(dimension, "general")
 
-    def get_role_weights(self, job_role: str) -> Dict[str, float]:
+    def get_role_weights(self, job_role: str) -> RoleWeights:
         """
         Get competency weights for a specific role.
 
@@ -75,27 +141,27 @@ class CompetencyEvaluator:
             job_role: The target job role
 
         Returns:
-            Dictionary of competency -> weight
+            Read-only mapping of competency -> weight, with ``.total``
         """
-        weights = self.config.get("role_competency_weights", {})
+        # Normalize before the cache lookup so casing/whitespace variants share an entry
+        return self._role_weights_for(job_role.strip().lower())
+
+    def _resolve_role_weights(self, job_lower: str) -> RoleWeights:
+        """Resolve weights for a normalized (stripped, lowercased) role."""
+        table = self._role_weights_table
 
         # Try exact match first
-        if job_role in weights:
-            return weights[job_role]
+        exact = table.get(job_lower)
+        if exact is not None:
+            return exact
 
         # Try fuzzy match (role contains keyword)
-        job_lower = job_role.lower()
-        for role, w in weights.items():
-            if role.lower() in job_lower or job_lower in role.lower():
+        for role, w in table.items():
+            if role in job_lower or job_lower in role:
                 return w
 
         # Fallback to default
-        return weights.get("default", {
-            "technical_depth": 0.35,
-            "communication": 0.20,
-            "problem_solving": 0.30,
-            "leadership": 0.15
-        })
+        return self._default_role_weights
 
     def get_stage_focus(self, stage_type: str) -> List[str]:
         """
@@ -121,17 +187,9 @@ class CompetencyEvaluator:
         Returns:
             Human-readable rubric level description
         """
-        competencies = self.config.get("competencies", {})
-        comp_config = competencies.get(competency, {})
-        rubric = comp_config.get("rubric", {})
-
-        for range_str, level in rubric.items():
-            try:
-                low, high = map(int, range_str.split("-"))
-                if low <= score <= high:
-                    return level
-            except ValueError:
-                continue
+        for low, high, level in self._rubric_ranges.get(competency, ()):
+            if low <= score <= high:
+                return level
 
         # Default descriptions
         if score >= 85:
@@ -167,46 +225,44 @@ class CompetencyEvaluator:
                 "summary": "No scoring data available"
             }
 
-        # Group scores by competency
-        competency_scores: Dict[str, List[float]] = defaultdict(list)
+        # Aggregate running sum/count per competency in a single pass
+        score_totals: Dict[str, float] = defaultdict(float)
+        score_counts: Dict[str, int] = defaultdict(int)
         competency_evidence: Dict[str, List[str]] = defaultdict(list)
+        map_dimension = self.map_dimension_to_competency
 
         for turn in turn_scores:
-            dimension = turn.get("dimension", "general")
-            score = turn.get("score", 50)
-            turn_num = turn.get("turn", 0)
+            competency = map_dimension(turn.get("dimension", "general"))
+            score_totals[competency] += turn.get("score", 50)
+            score_counts[competency] += 1
 
-            competency = self.map_dimension_to_competency(dimension)
-            competency_scores[competency].append(score)
-            competency_evidence[competency].append(f"Turn {turn_num}")
+            evidence = competency_evidence[competency]
+            if len(evidence) < MAX_EVIDENCE:
+                evidence.append(f"Turn {turn.get('turn', 0)}")
 
         # Compute per-competency results
         results: Dict[str, CompetencyScore] = {}
-        for comp, scores in competency_scores.items():
-            avg_score = sum(scores) / len(scores)
+        for comp, total in score_totals.items():
+            count = score_counts[comp]
+            avg_score = total / count
             results[comp] = CompetencyScore(
                 competency=comp,
                 score=round(avg_score, 1),
                 rubric_level=self.get_rubric_level(comp, avg_score),
-                evidence=competency_evidence[comp][:5],  # Limit evidence
-                sample_size=len(scores)
+                evidence=competency_evidence[comp],
+                sample_size=count
             )
 
         # Compute role fit score (weighted average)
         weights = self.get_role_weights(job_role)
         role_fit = 0.0
-        weight_sum = 0.0
 
         for comp, weight in weights.items():
-            if comp in results:
-                role_fit += results[comp].score * weight
-                weight_sum += weight
-            else:
-                # If competency not measured, use neutral score
-                role_fit += 50.0 * weight
-                weight_sum += weight
+            # If competency not measured, use neutral score
+            score = results[comp].score if comp in results else 50.0
+            role_fit += score * weight
 
-        role_fit_score = role_fit / weight_sum if weight_sum > 0 else 50.0
+        role_fit_score = role_fit / weights.total if weights.total > 0 else 50.0
 
         # Generate summary
         summary = self._generate_summary(results, role_fit_score, job_role)
@@ -222,7 +278,7 @@ class CompetencyEvaluator:
                 for comp, cs in results.items()
             },
             "role_fit_score": round(role_fit_score, 1),
-            "role_weights_used": weights,
+            "role_weights_used": dict(weights),
             "summary": summary
         }
 
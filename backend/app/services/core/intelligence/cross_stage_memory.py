@@ -7,7 +7,7 @@ Enables continuity across HR -> Technical -> Behavioral pipeline.
 import json
 import logging
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from google import genai
 from sqlalchemy import update, select
 from sqlalchemy.dialects.postgresql import JSONB
@@ -37,7 +37,20 @@ class StageInsights:
     notes: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat projection; asdict() would deepcopy every list field
+        return {
+            "stage_type": self.stage_type,
+            "summary": self.summary,
+            "communication_style": self.communication_style,
+            "verified_skills": list(self.verified_skills),
+            "red_flags": list(self.red_flags),
+            "strengths": list(self.strengths),
+            "concerns": list(self.concerns),
+            "key_topics_covered": list(self.key_topics_covered),
+            "overall_score": self.overall_score,
+            "confidence": self.confidence,
+            "notes": self.notes
+        }
 
 
 class CrossStageMemory:
@@ -5,12 +5,16 @@ Dynamically adjusts interview difficulty based on candidate performance.
 Implements hysteresis to prevent rapid oscillation between levels.
 """
 import logging
+from collections import deque
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Deque, Iterable, Optional, Dict, Any, Sequence, Tuple
+from dataclasses import dataclass, field
 
 logger = logging.getLogger("difficulty-adapter")
 
+# Default number of recent scores kept in a DifficultyState window
+DEFAULT_WINDOW_SIZE = 3
+
 
 class DifficultyLevel(Enum):
     """Interview difficulty levels."""
@@ -42,14 +46,54 @@ class DifficultyLevel(Enum):
         return guidance.get(self.value, "")
 
 
-@dataclass
+# Level lookup by stored value; a plain dict probe instead of Enum.__call__
+_LEVEL_BY_STR: Dict[str, DifficultyLevel] = {level.value: level for level in DifficultyLevel}
+
+
+def validate_levels() -> None:
+    """Check every DifficultyLevel has usable prompt text; raises ValueError if not."""
+    for level in DifficultyLevel:
+        if len(level.description) <= 10:
+            raise ValueError(f"Difficulty level {level.value!r} is missing a description")
+        if len(level.question_guidance) <= 20:
+            raise ValueError(f"Difficulty level {level.value!r} is missing question guidance")
+
+
+# Level text is static, so check it once at import (skipped under python -O)
+if __debug__:
+    validate_levels()
+
+
+def _window_step(
+    window: Sequence[float],
+    increase_threshold: float,
+    decrease_threshold: float
+) -> Tuple[int, float, float]:
+    """
+    Numeric core of DifficultyAdapter.update.
+
+    Returns (step, avg_score, trend) where step is +1 to increase,
+    -1 to decrease or 0 to hold the current level.
+    """
+    avg_score = sum(window) / len(window)
+    trend = window[-1] - window[0]
+
+    if avg_score >= increase_threshold and trend >= 0:
+        return 1, avg_score, trend
+    if avg_score <= decrease_threshold and trend <= 0:
+        return -1, avg_score, trend
+    return 0, avg_score, trend
+
+
+@dataclass(slots=True)
 class DifficultyState:
     """Current difficulty state with metadata."""
     level: DifficultyLevel
     turns_at_level: int
     last_change_turn: int
     change_reason: Optional[str]
-    score_window: List[float]  # Recent scores for decision making
+    # Recent scores for decision making; a bounded deque so the cap is O(1)
+    score_window: Deque[float] = field(default_factory=lambda: deque(maxlen=DEFAULT_WINDOW_SIZE))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -58,11 +102,11 @@ class DifficultyState:
             "turns_at_level": self.turns_at_level,
             "last_change_turn": self.last_change_turn,
             "change_reason": self.change_reason,
-            "score_window": self.score_window
+            "score_window": list(self.score_window)
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DifficultyState":
+    def from_dict(cls, data: Dict[str, Any], window_size: int = DEFAULT_WINDOW_SIZE) -> "DifficultyState":
         """Create from dictionary."""
         if not data:
             return cls(
@@ -70,14 +114,14 @@ class DifficultyState:
                 turns_at_level=0,
                 last_change_turn=0,
                 change_reason=None,
-                score_window=[]
+                score_window=deque(maxlen=window_size)
             )
         return cls(
-            level=DifficultyLevel(data.get("level", "intermediate")),
+            level=_LEVEL_BY_STR[data.get("level", DifficultyLevel.INTERMEDIATE.value)],
             turns_at_level=data.get("turns_at_level", 0),
             last_change_turn=data.get("last_change_turn", 0),
             change_reason=data.get("change_reason"),
-            score_window=data.get("score_window", [])
+            score_window=deque(data.get("score_window", []), maxlen=window_size)
         )
 
 
@@ -94,7 +138,7 @@ class DifficultyAdapter:
         increase_threshold: float = 80.0,
         decrease_threshold: float = 50.0,
         min_turns_at_level: int = 2,
-        window_size: int = 3
+        window_size: int = DEFAULT_WINDOW_SIZE
     ):
         """
         Initialize the difficulty adapter.
@@ -123,7 +167,7 @@ class DifficultyAdapter:
             turns_at_level=0,
             last_change_turn=0,
             change_reason="Initial level",
-            score_window=[]
+            score_window=deque(maxlen=self.window_size)
         )
 
     def update(
@@ -135,18 +179,22 @@ class DifficultyAdapter:
         """
         Update difficulty state based on new score.
 
+        The state is mutated in place and returned, so a long session reuses
+        one DifficultyState instead of allocating one per level change.
+
         Args:
             state: Current difficulty state
             new_score: Score from the latest answer (0-100)
             current_turn: Current turn number
 
         Returns:
-            Updated DifficultyState (may have changed level)
+            The same DifficultyState, updated (may have changed level)
         """
-        # Add score to window
-        state.score_window.append(new_score)
-        if len(state.score_window) > self.window_size:
-            state.score_window = state.score_window[-self.window_size:]
+        # Add score to window (the deque's maxlen drops the oldest score)
+        window = state.score_window
+        if not isinstance(window, deque) or window.maxlen != self.window_size:
+            window = state.score_window = deque(window, maxlen=self.window_size)
+        window.append(new_score)
 
         state.turns_at_level += 1
 
@@ -158,21 +206,21 @@ class DifficultyAdapter:
         if state.turns_at_level < self.min_turns_at_level:
             return state
 
-        # Calculate metrics
-        avg_score = sum(state.score_window) / len(state.score_window)
-        trend = state.score_window[-1] - state.score_window[0]
+        # Calculate metrics and decide
+        step, avg_score, trend = _window_step(
+            state.score_window, self.increase_threshold, self.decrease_threshold
+        )
 
-        # Decision logic
         new_level = state.level
         reason = None
 
-        if avg_score >= self.increase_threshold and trend >= 0:
+        if step > 0:
             # Candidate is doing very well, increase difficulty
             new_level = self._increase_level(state.level)
             if new_level != state.level:
                 reason = f"High performance (avg: {avg_score:.1f}, trend: +{trend:.1f})"
 
-        elif avg_score <= self.decrease_threshold and trend <= 0:
+        elif step < 0:
             # Candidate is struggling, decrease difficulty
             new_level = self._decrease_level(state.level)
             if new_level != state.level:
@@ -184,14 +232,29 @@ class DifficultyAdapter:
                 f"Difficulty change: {state.level.value} -> {new_level.value} "
                 f"(reason: {reason})"
             )
-            return DifficultyState(
-                level=new_level,
-                turns_at_level=0,
-                last_change_turn=current_turn,
-                change_reason=reason,
-                score_window=state.score_window  # Keep window for continuity
-            )
+            # Keep the score window for continuity
+            state.level = new_level
+            state.turns_at_level = 0
+            state.last_change_turn = current_turn
+            state.change_reason = reason
+
+        return state
 
+    def update_batch(
+        self,
+        state: DifficultyState,
+        scores: Iterable[float],
+        start_turn: int
+    ) -> DifficultyState:
+        """
+        Apply consecutive scores in one call (e.g. when replaying a session).
+
+        Equivalent to calling update() once per score, with turns numbered
+        from start_turn.
+        """
+        update = self.update
+        for turn, score in enumerate(scores, start_turn):
+            state = update(state, score, turn)
         return state
 
     def _increase_level(self, current: DifficultyLevel) -> DifficultyLevel:
@@ -9,7 +9,7 @@ Generates contextual interview questions based on:
 """
 import json
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from google import genai
 from pathlib import Path
@@ -32,7 +32,15 @@ class GeneratedQuestion:
     follow_up_hints: List[str]  # Potential follow-ups
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat projection; asdict() would deepcopy follow_up_hints
+        return {
+            "question": self.question,
+            "target_competency": self.target_competency,
+            "difficulty": self.difficulty,
+            "context_used": self.context_used,
+            "topic": self.topic,
+            "follow_up_hints": list(self.follow_up_hints)
+        }
 
 
 class QuestionGenerator:
@@ -7,7 +7,8 @@ Provides feedback, follow-up suggestions, and competency mapping.
 import json
 import logging
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Dict, Any, Optional, List
 from google import genai
 from jinja2 import Template
@@ -17,7 +18,7 @@ from config.settings import get_settings
 logger = logging.getLogger("scoring-engine")
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerScore:
     """Detailed scoring result for a candidate answer."""
     # Overall score (0-100)
@@ -42,7 +43,14 @@ class AnswerScore:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # All fields are scalars, so a flat projection matches asdict();
+        # one attrgetter call fetches every value at once
+        return dict(zip(_ANSWER_SCORE_FIELDS, _ANSWER_SCORE_VALUES(self)))
+
+
+# Field names resolved once instead of walking fields() per to_dict call
+_ANSWER_SCORE_FIELDS = tuple(f.name for f in fields(AnswerScore))
+_ANSWER_SCORE_VALUES = attrgetter(*_ANSWER_SCORE_FIELDS)
 
 
 class ScoringEngine:
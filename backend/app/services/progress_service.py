@@ -8,13 +8,15 @@ Handles:
 - Progress snapshots
 """
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, func, and_, cast, column, true, Float, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Row
 
 from app.models.gamification import UserProgress, UserResolution, SkillSnapshot
 from app.models.interview import InterviewSession, InterviewApplication
@@ -33,6 +35,50 @@ DEFAULT_SKILL_DIMENSIONS = [
     "adaptability"
 ]
 
+# Points below target that count as a significant gap
+SIGNIFICANT_GAP = 15
+
+# Points above target that count as a strength
+STRENGTH_MARGIN = 10
+
+# Indexed by sign(trend) + 1
+TREND_DIRECTIONS = ("down", "stable", "up")
+
+
+# Default skill targets by role seniority, used when no resolution is active
+ROLE_TARGETS = {
+    "senior": {
+        "technical_depth": 80,
+        "communication": 75,
+        "problem_solving": 80,
+        "system_design": 75,
+        "leadership": 70,
+        "adaptability": 70
+    },
+    "mid": {
+        "technical_depth": 70,
+        "communication": 65,
+        "problem_solving": 70,
+        "system_design": 60,
+        "leadership": 55,
+        "adaptability": 65
+    },
+    "default": {
+        "technical_depth": 60,
+        "communication": 60,
+        "problem_solving": 60,
+        "system_design": 50,
+        "leadership": 50,
+        "adaptability": 60
+    }
+}
+
+
+def trend_direction(trend: Optional[float]) -> str:
+    """Map a week-over-week score delta to "up", "down" or "stable" (None is stable)."""
+    trend = trend or 0
+    return TREND_DIRECTIONS[(trend > 0) - (trend < 0) + 1]
+
 
 class ProgressService:
     """Service for tracking personal growth and learning progress."""
@@ -68,22 +114,29 @@ class ProgressService:
                 for skill, level in baseline.items()
             }
 
-        resolution = UserResolution(
-            user_id=user_id,
-            title=title,
-            description=description,
-            target_role=target_role,
-            target_skills=target_skills,
-            baseline_skills=baseline,
-            target_date=target_date or datetime(2026, 12, 31),
-            status="active"
-        )
+        fields = {
+            "user_id": user_id,
+            "title": title,
+            "description": description,
+            "target_role": target_role,
+            "target_skills": target_skills,
+            "baseline_skills": baseline,
+            "target_date": target_date or datetime(2026, 12, 31),
+            "status": "active"
+        }
 
-        self.db.add(resolution)
+        # INSERT ... RETURNING replaces add + commit + refresh (no follow-up SELECT)
+        stmt = (
+            insert(UserResolution)
+            .values(**fields)
+            .returning(UserResolution.id, UserResolution.created_at)
+        )
+        row = (await self.db.execute(stmt)).one()
         await self.db.commit()
-        await self.db.refresh(resolution)
 
-        logger.info(f"Created resolution '{title}' for user {user_id}")
+        resolution = UserResolution(**fields, **row._mapping)
+
+        logger.info("Created resolution '%s' for user %s", title, user_id)
         return resolution
 
     async def get_user_resolutions(
@@ -120,14 +173,19 @@ class ProgressService:
         user_id: str,
         **updates
     ) -> Optional[UserResolution]:
-        """Update a resolution."""
+        """Update a resolution. Skips the commit when nothing actually changed."""
         resolution = await self.get_resolution(resolution_id, user_id)
         if not resolution:
             return None
 
+        dirty = False
         for key, value in updates.items():
-            if hasattr(resolution, key) and value is not None:
+            if hasattr(resolution, key) and value is not None and getattr(resolution, key) != value:
                 setattr(resolution, key, value)
+                dirty = True
+
+        if not dirty:
+            return resolution
 
         await self.db.commit()
         await self.db.refresh(resolution)
@@ -149,7 +207,7 @@ class ProgressService:
         await self.db.commit()
         await self.db.refresh(resolution)
 
-        logger.info(f"Resolution {resolution_id} completed for user {user_id}")
+        logger.info("Resolution %s completed for user %s", resolution_id, user_id)
         return resolution
 
     async def get_resolution_progress(
@@ -165,6 +223,7 @@ class ProgressService:
         if not resolution:
             return None
 
+        now = datetime.utcnow()
         current_skills = await self._get_current_skill_levels(user_id)
         baseline = resolution.baseline_skills or {}
         targets = resolution.target_skills or {}
@@ -201,7 +260,7 @@ class ProgressService:
             "target_date": resolution.target_date.isoformat() if resolution.target_date else None,
             "skills_progress": progress,
             "overall_progress": round(overall_progress / skill_count, 1) if skill_count > 0 else 0,
-            "days_remaining": (resolution.target_date - datetime.utcnow()).days if resolution.target_date else None
+            "days_remaining": (resolution.target_date - now).days if resolution.target_date else None
         }
 
     # ==================== SKILL GAP ANALYSIS ====================
@@ -227,7 +286,31 @@ class ProgressService:
         # Get target requirements (from latest resolution or default)
         target_requirements = await self._get_target_requirements(user_id, target_role)
 
-        # Calculate gaps
+        gaps, strengths = self._classify_skill_gaps(current_skills, target_requirements, verified_skills)
+
+        return {
+            "user_id": user_id,
+            "target_role": target_role,
+            "current_skills": current_skills,
+            "target_requirements": target_requirements,
+            "verified_skills": list(verified_skills.keys()),
+            "gaps": gaps,
+            "strengths": strengths,
+            "identified_gaps_from_interviews": identified_gaps,
+            "recommendations": self._generate_gap_recommendations(gaps, identified_gaps),
+            "analyzed_at": datetime.utcnow().isoformat()
+        }
+
+    def _classify_skill_gaps(
+        self,
+        current_skills: Dict[str, int],
+        target_requirements: Dict[str, int],
+        verified_skills: Dict[str, Dict]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split target skills into significant gaps and strengths.
+        Gaps are sorted largest first, strengths by how far they exceed the target.
+        """
         gaps = []
         strengths = []
 
@@ -235,36 +318,26 @@ class ProgressService:
             current = current_skills.get(skill, 0)
             gap = target - current
 
-            skill_data = {
+            if gap > SIGNIFICANT_GAP:
+                bucket = gaps
+            elif gap < -STRENGTH_MARGIN:  # Exceeds target
+                bucket = strengths
+            else:
+                continue
+
+            bucket.append({
                 "skill": skill,
                 "current": current,
                 "target": target,
                 "gap": gap,
                 "verified": skill in verified_skills,
                 "evidence": verified_skills.get(skill, {}).get("evidence", None)
-            }
-
-            if gap > 15:  # Significant gap
-                gaps.append(skill_data)
-            elif gap < -10:  # Exceeds target
-                strengths.append(skill_data)
+            })
 
         # Sort gaps by severity
         gaps.sort(key=lambda x: x["gap"], reverse=True)
         strengths.sort(key=lambda x: x["gap"])
-
-        return {
-            "user_id": user_id,
-            "target_role": target_role,
-            "current_skills": current_skills,
-            "target_requirements": target_requirements,
-            "verified_skills": list(verified_skills.keys()),
-            "gaps": gaps,
-            "strengths": strengths,
-            "identified_gaps_from_interviews": identified_gaps,
-            "recommendations": self._generate_gap_recommendations(gaps, identified_gaps),
-            "analyzed_at": datetime.utcnow().isoformat()
-        }
+        return gaps, strengths
 
     def _generate_gap_recommendations(
         self,
@@ -307,16 +380,20 @@ class ProgressService:
         """
         Generate AI-powered weekly insights based on recent performance.
         """
-        # Get sessions from the past week
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        sessions = await self._get_recent_sessions(user_id, since=week_ago)
+        # Capture the clock once so every timestamp in the report agrees
+        now = datetime.utcnow()
+        week_ago = now - timedelta(days=7)
+        two_weeks_ago = now - timedelta(days=14)
+
+        # Count/average this week and last week in one query before loading any rows
+        stats = await self._get_weekly_score_stats(user_id, week_ago, two_weeks_ago)
 
-        if not sessions:
+        if not stats.sessions_count:
             return {
                 "user_id": user_id,
                 "period": "weekly",
                 "period_start": week_ago.isoformat(),
-                "period_end": datetime.utcnow().isoformat(),
+                "period_end": now.isoformat(),
                 "sessions_count": 0,
                 "message": "No interview sessions this week. Start practicing to get personalized insights!",
                 "recommendations": [
@@ -326,19 +403,15 @@ class ProgressService:
                 ]
             }
 
-        # Calculate statistics
-        scores = [s.overall_score for s in sessions if s.overall_score is not None]
-        avg_score = sum(scores) / len(scores) if scores else 0
+        avg_score = float(stats.avg_score) if stats.avg_score is not None else 0
+        prev_avg = float(stats.prev_avg) if stats.prev_avg is not None else None
+
+        # Only the columns needed for competencies and the AI prompt
+        sessions = await self._get_session_summaries(user_id, since=week_ago)
 
         # Aggregate competency data
         competencies = await self._aggregate_competencies(sessions)
 
-        # Get previous week for comparison
-        two_weeks_ago = week_ago - timedelta(days=7)
-        prev_sessions = await self._get_recent_sessions(user_id, since=two_weeks_ago, until=week_ago)
-        prev_scores = [s.overall_score for s in prev_sessions if s.overall_score is not None]
-        prev_avg = sum(prev_scores) / len(prev_scores) if prev_scores else None
-
         # Calculate trend
         trend = None
         if prev_avg is not None:
@@ -359,29 +432,29 @@ class ProgressService:
             competencies=competencies,
             avg_score=avg_score,
             period_start=week_ago,
-            period_end=datetime.utcnow()
+            period_end=now
         )
 
         return {
             "user_id": user_id,
             "period": "weekly",
             "period_start": week_ago.isoformat(),
-            "period_end": datetime.utcnow().isoformat(),
+            "period_end": now.isoformat(),
             "sessions_count": len(sessions),
             "average_score": round(avg_score, 1),
             "score_trend": round(trend, 1) if trend is not None else None,
-            "trend_direction": "up" if trend and trend > 0 else "down" if trend and trend < 0 else "stable",
+            "trend_direction": trend_direction(trend),
             "competencies": competencies,
             "strengths": insights.get("strengths", []),
             "areas_to_improve": insights.get("areas_to_improve", []),
             "recommendations": insights.get("recommendations", []),
             "highlights": insights.get("highlights", []),
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": now.isoformat()
         }
 
     async def _generate_ai_insights(
         self,
-        sessions: List[InterviewSession],
+        sessions: List[Row],
         avg_score: float,
         competencies: Dict[str, float],
         trend: Optional[float]
@@ -396,7 +469,7 @@ class ProgressService:
             session_summaries = []
             for s in sessions[:5]:  # Limit to last 5
                 session_summaries.append({
-                    "role": s.application.job_role if s.application else "Unknown",
+                    "role": s.job_role or "Unknown",
                     "stage": s.stage_type,
                     "score": s.overall_score,
                     "competencies": s.competency_scores or {}
@@ -511,27 +584,46 @@ Be specific, encouraging, and actionable. Focus on growth mindset."""
         return {skill: 50 for skill in DEFAULT_SKILL_DIMENSIONS}
 
     async def _get_verified_skills(self, user_id: str) -> Dict[str, Dict]:
-        """Get skills verified through interview sessions."""
-        # Get recent sessions with candidate profiles
-        query = (
-            select(InterviewSession)
+        """
+        Get skills verified through interview sessions.
+
+        Merges verified_skills across the 10 most recent profiled sessions
+        inside Postgres (jsonb_each), keeping the deepest entry per skill
+        (most recent wins on ties), so only the merged map is transferred.
+        """
+        recent = (
+            select(InterviewSession.candidate_profile, InterviewSession.created_at)
             .join(InterviewApplication)
             .where(InterviewApplication.user_id == user_id)
             .where(InterviewSession.candidate_profile.isnot(None))
             .order_by(InterviewSession.created_at.desc())
             .limit(10)
+            .subquery()
+        )
+        skill = (
+            func.jsonb_each(
+                func.coalesce(recent.c.candidate_profile["verified_skills"], cast("{}", JSONB))
+            )
+            .table_valued(column("key", String), column("value", JSONB))
+            .lateral()
+        )
+        depth = func.coalesce(skill.c.value["depth"].astext.cast(Float), 0)
+        ranked = (
+            select(
+                skill.c.key,
+                skill.c.value,
+                func.row_number().over(
+                    partition_by=skill.c.key,
+                    order_by=(depth.desc(), recent.c.created_at.desc())
+                ).label("rank")
+            )
+            .select_from(recent)
+            .join(skill, true())
+            .subquery()
         )
+        query = select(ranked.c.key, ranked.c.value).where(ranked.c.rank == 1)
         result = await self.db.execute(query)
-        sessions = result.scalars().all()
-
-        verified = {}
-        for session in sessions:
-            profile = session.candidate_profile or {}
-            for skill, data in profile.get("verified_skills", {}).items():
-                if skill not in verified or data.get("depth", 0) > verified[skill].get("depth", 0):
-                    verified[skill] = data
-
-        return verified
+        return dict(result.all())
 
     async def _get_identified_gaps(self, user_id: str) -> List[str]:
         """Get identified skill gaps from interview sessions."""
@@ -565,89 +657,83 @@ Be specific, encouraging, and actionable. Focus on growth mindset."""
         if resolutions:
             return resolutions[0].target_skills or {}
 
-        # Default targets based on role
-        role_targets = {
-            "senior": {
-                "technical_depth": 80,
-                "communication": 75,
-                "problem_solving": 80,
-                "system_design": 75,
-                "leadership": 70,
-                "adaptability": 70
-            },
-            "mid": {
-                "technical_depth": 70,
-                "communication": 65,
-                "problem_solving": 70,
-                "system_design": 60,
-                "leadership": 55,
-                "adaptability": 65
-            },
-            "default": {
-                "technical_depth": 60,
-                "communication": 60,
-                "problem_solving": 60,
-                "system_design": 50,
-                "leadership": 50,
-                "adaptability": 60
-            }
-        }
-
         if target_role:
             role_lower = target_role.lower()
             if "senior" in role_lower or "lead" in role_lower:
-                return role_targets["senior"]
+                return ROLE_TARGETS["senior"]
             elif "mid" in role_lower:
-                return role_targets["mid"]
+                return ROLE_TARGETS["mid"]
 
-        return role_targets["default"]
+        # Default targets based on role (shared, do not mutate)
+        return ROLE_TARGETS["default"]
 
-    async def _get_recent_sessions(
+    async def _get_weekly_score_stats(
         self,
         user_id: str,
-        since: datetime,
-        until: Optional[datetime] = None
-    ) -> List[InterviewSession]:
-        """Get user's interview sessions within a date range."""
+        week_ago: datetime,
+        two_weeks_ago: datetime
+    ) -> Row:
+        """
+        Get session count and average score for this week, plus last week's
+        average, from completed sessions in a single aggregate query.
+        """
+        this_week = InterviewSession.created_at >= week_ago
+        last_week = InterviewSession.created_at < week_ago
         query = (
-            select(InterviewSession)
+            select(
+                func.count().filter(this_week).label("sessions_count"),
+                func.avg(InterviewSession.overall_score).filter(this_week).label("avg_score"),
+                func.avg(InterviewSession.overall_score).filter(last_week).label("prev_avg")
+            )
+            .select_from(InterviewSession)
             .join(InterviewApplication)
-            .options(selectinload(InterviewSession.application))
             .where(InterviewApplication.user_id == user_id)
-            .where(InterviewSession.created_at >= since)
+            .where(InterviewSession.created_at >= two_weeks_ago)
             .where(InterviewSession.status == "completed")
         )
+        result = await self.db.execute(query)
+        return result.one()
 
-        if until:
-            query = query.where(InterviewSession.created_at < until)
-
-        query = query.order_by(InterviewSession.created_at.desc())
+    async def _get_session_summaries(
+        self,
+        user_id: str,
+        since: datetime
+    ) -> List[Row]:
+        """Get lightweight rows for the user's completed sessions since a date."""
+        query = (
+            select(
+                InterviewSession.stage_type,
+                InterviewSession.overall_score,
+                InterviewSession.competency_scores,
+                InterviewApplication.job_role
+            )
+            .join(InterviewApplication)
+            .where(InterviewApplication.user_id == user_id)
+            .where(InterviewSession.created_at >= since)
+            .where(InterviewSession.status == "completed")
+            .order_by(InterviewSession.created_at.desc())
+        )
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def _aggregate_competencies(
         self,
-        sessions: List[InterviewSession]
+        sessions: List[Row]
     ) -> Dict[str, float]:
         """Aggregate competency scores across sessions."""
-        competencies = {}
-        counts = {}
+        # Running sum/count per competency in a single pass
+        totals: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
 
         for session in sessions:
-            if session.competency_scores:
-                for comp, data in session.competency_scores.items():
-                    score = data.get("score", 0) if isinstance(data, dict) else data
-                    if comp not in competencies:
-                        competencies[comp] = 0
-                        counts[comp] = 0
-                    competencies[comp] += score
-                    counts[comp] += 1
-
-        # Calculate averages
+            for comp, data in (session.competency_scores or {}).items():
+                totals[comp] += data.get("score", 0) if isinstance(data, dict) else data
+                counts[comp] += 1
+
+        # Calculate averages (every comp in totals has a count >= 1)
         return {
             comp: round(total / counts[comp], 1)
-            for comp, total in competencies.items()
-            if counts.get(comp, 0) > 0
+            for comp, total in totals.items()
         }
 
     async def _ensure_user_progress_exists(self, user_id: str) -> UserProgress:
@@ -668,14 +754,14 @@ Be specific, encouraging, and actionable. Focus on growth mindset."""
             self.db.add(progress)
             await self.db.commit()
             await self.db.refresh(progress)
-            logger.info(f"Created default user_progress for user {user_id}")
+            logger.info("Created default user_progress for user %s", user_id)
 
         return progress
 
     async def _create_weekly_snapshot(
         self,
         user_id: str,
-        sessions: List[InterviewSession],
+        sessions: List[Row],
         competencies: Dict[str, float],
         avg_score: float,
         period_start: datetime,
@@ -687,21 +773,26 @@ Be specific, encouraging, and actionable. Focus on growth mindset."""
 
         skill_levels = await self._get_current_skill_levels(user_id)
 
-        snapshot = SkillSnapshot(
-            user_id=user_id,
-            skill_levels=skill_levels,
-            competency_averages=competencies,
-            sessions_count=len(sessions),
-            average_score=int(avg_score),
-            snapshot_type="weekly",
-            period_start=period_start,
-            period_end=period_end
-        )
+        fields = {
+            "user_id": user_id,
+            "skill_levels": skill_levels,
+            "competency_averages": competencies,
+            "sessions_count": len(sessions),
+            "average_score": int(avg_score),
+            "snapshot_type": "weekly",
+            "period_start": period_start,
+            "period_end": period_end
+        }
 
-        self.db.add(snapshot)
+        stmt = (
+            insert(SkillSnapshot)
+            .values(**fields)
+            .returning(SkillSnapshot.id, SkillSnapshot.created_at)
+        )
+        row = (await self.db.execute(stmt)).one()
         await self.db.commit()
 
-        return snapshot
+        return SkillSnapshot(**fields, **row._mapping)
 
     async def get_skill_history(
         self,
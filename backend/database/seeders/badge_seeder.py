@@ -4,10 +4,11 @@ Badge Seeder - Seeds achievement/badge definitions.
 This seeds the MASTER DATA for badges (achievements table).
 For testing user badge awards, use scripts/dev/award_badges.py
 """
+import json
+
 from database.seeders.base import BaseSeeder
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert
-from app.models.gamification import Achievement
 
 
 # Badge Definitions
@@ -78,6 +79,35 @@ BADGES = [
 ]
 
 
+# Upsert - update only rows whose definition changed (JSON has no
+# equality operator, so compare as JSONB)
+UPSERT_SQL = text("""
+INSERT INTO achievements (id, name, description, icon_url, criteria)
+VALUES (:id, :name, :description, :icon_url, :criteria)
+ON CONFLICT (id) DO UPDATE SET
+    name = EXCLUDED.name,
+    description = EXCLUDED.description,
+    icon_url = EXCLUDED.icon_url,
+    criteria = EXCLUDED.criteria
+WHERE achievements.name::jsonb IS DISTINCT FROM EXCLUDED.name::jsonb
+   OR achievements.description::jsonb IS DISTINCT FROM EXCLUDED.description::jsonb
+   OR achievements.icon_url IS DISTINCT FROM EXCLUDED.icon_url
+   OR achievements.criteria::jsonb IS DISTINCT FROM EXCLUDED.criteria::jsonb
+""")
+
+# UPSERT_SQL parameters with JSON columns serialized once at import
+_BADGE_ROWS = [
+    {
+        "id": b["id"],
+        "name": json.dumps(b["name"]),
+        "description": json.dumps(b["description"]),
+        "icon_url": b["icon_url"],
+        "criteria": json.dumps(b["criteria"])
+    }
+    for b in BADGES
+]
+
+
 class BadgeSeeder(BaseSeeder):
     """Seeds badge/achievement definitions."""
     
@@ -85,31 +115,10 @@ class BadgeSeeder(BaseSeeder):
     description = "Seed badge definitions to achievements table"
     
     async def run(self, db: AsyncSession) -> int:
-        count = 0
-        
-        for badge in BADGES:
-            stmt = insert(Achievement).values(
-                id=badge["id"],
-                name=badge["name"],
-                description=badge["description"],
-                icon_url=badge["icon_url"],
-                criteria=badge["criteria"]
-            )
-            
-            # Upsert - update if exists
-            update_stmt = stmt.on_conflict_do_update(
-                index_elements=['id'],
-                set_=dict(
-                    name=stmt.excluded.name,
-                    description=stmt.excluded.description,
-                    icon_url=stmt.excluded.icon_url,
-                    criteria=stmt.excluded.criteria
-                )
-            )
-            
-            await db.execute(update_stmt)
-            count += 1
+        # A list of parameter sets is sent as one asyncpg executemany,
+        # inside the session's transaction
+        await db.execute(UPSERT_SQL, _BADGE_ROWS)
         
-        await db.commit()
+        count = len(BADGES)
         self.log(f"✅ Seeded {count} badges")
         return count
@@ -10,12 +10,20 @@ Usage:
             pass
 """
 from abc import ABC, abstractmethod
+from typing import Iterable
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 logger = logging.getLogger("seeders")
 
 
+async def existing_ids(db: AsyncSession, model, ids: Iterable) -> set:
+    """Return the subset of ids already present in model's table, in one query."""
+    result = await db.execute(select(model.id).where(model.id.in_(list(ids))))
+    return set(result.scalars().all())
+
+
 class BaseSeeder(ABC):
     """Base class for all seeders."""
     
@@ -25,7 +33,8 @@ class BaseSeeder(ABC):
     @abstractmethod
     async def run(self, db: AsyncSession) -> int:
         """
-        Execute the seeder.
+        Execute the seeder. Do not commit; the runner commits once the
+        seeder (or the whole batch sharing its session) has finished.
         
         Returns:
             Number of records seeded.
@@ -35,7 +44,8 @@ class BaseSeeder(ABC):
     async def should_run(self, db: AsyncSession) -> bool:
         """
         Check if seeder should run (e.g., check if already seeded).
-        Override in subclass for conditional seeding.
+        Override in subclass for conditional seeding. To check which rows
+        already exist, use existing_ids() rather than one select per id.
         
         Returns:
             True if seeder should run, False to skip.
@@ -3,46 +3,112 @@ Career Node Seeder - Seeds career tree nodes from YAML.
 
 Syncs nodes defined in config/career_tree.yaml to the career_nodes table.
 """
+import json
+
 from database.seeders.base import BaseSeeder
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import cast, or_, select, table, column, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from app.models.gamification import CareerNode
 from app.services.core.gamification.career_manager import career_manager
 
 
+# Rows per multi-values INSERT; Postgres gains flatten out past ~1000 rows
+BATCH_SIZE = 1000
+
+# Above this many nodes, COPY into a staging table instead of multi-values INSERTs
+COPY_THRESHOLD = 1024
+
+STAGING_TABLE = "career_nodes_staging"
+STAGING_COLUMNS = ["id", "title", "rank_required", "type", "metadata"]
+
+
+def _upsert(stmt):
+    """Attach the career node upsert clause to an INSERT statement."""
+    # Update only rows whose definition changed (JSON has no
+    # equality operator, so compare as JSONB)
+    return stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_=dict(
+            title=stmt.excluded.title,
+            type=stmt.excluded.type,
+            rank_required=stmt.excluded.rank_required,
+            metadata=stmt.excluded.metadata
+        ),
+        where=or_(
+            cast(CareerNode.title, JSONB).is_distinct_from(cast(stmt.excluded.title, JSONB)),
+            CareerNode.type.is_distinct_from(stmt.excluded.type),
+            CareerNode.rank_required.is_distinct_from(stmt.excluded.rank_required),
+            cast(CareerNode.metadata_, JSONB).is_distinct_from(cast(stmt.excluded.metadata, JSONB))
+        )
+    )
+
+
 class CareerNodeSeeder(BaseSeeder):
     """Seeds career nodes from YAML config."""
-    
+
     name = "career_nodes"
     description = "Seed career tree nodes from config/career_tree.yaml"
-    
+
     async def run(self, db: AsyncSession) -> int:
         nodes_data = career_manager.get_all_nodes()
-        count = 0
-        
-        for node_def in nodes_data:
-            stmt = insert(CareerNode).values(
-                id=node_def['id'],
-                title=node_def['title'],
-                type=node_def['type'],
-                rank_required=node_def.get('rank_required', 1),
-                metadata_=node_def  # Store everything as JSON
-            )
-            
-            # Upsert
-            update_stmt = stmt.on_conflict_do_update(
-                index_elements=['id'],
-                set_=dict(
-                    title=stmt.excluded.title,
-                    type=stmt.excluded.type,
-                    rank_required=stmt.excluded.rank_required,
-                    metadata=stmt.excluded.metadata
-                )
-            )
-            
-            await db.execute(update_stmt)
-            count += 1
-        
-        await db.commit()
+        rows = [
+            {
+                "id": node_def['id'],
+                "title": node_def['title'],
+                "type": node_def['type'],
+                "rank_required": node_def.get('rank_required', 1),
+                "metadata_": node_def  # Store everything as JSON
+            }
+            for node_def in nodes_data
+        ]
+
+        if len(rows) > COPY_THRESHOLD:
+            await self._copy_upsert(db, rows)
+        else:
+            for start in range(0, len(rows), BATCH_SIZE):
+                stmt = insert(CareerNode).values(rows[start:start + BATCH_SIZE])
+                await db.execute(_upsert(stmt))
+
+        count = len(rows)
         self.log(f"✅ Seeded {count} career nodes")
         return count
+
+    async def _copy_upsert(self, db: AsyncSession, rows: list[dict]) -> None:
+        """
+        Bulk path for large trees: COPY rows into a temp staging table over
+        asyncpg's binary protocol, then upsert with one INSERT ... SELECT.
+        The staging table is dropped when the transaction commits.
+
+        The CREATE TEMP TABLE goes through the session first, so the
+        session's transaction is open before the raw COPY runs and the
+        COPY joins it.
+        """
+        await db.execute(text(
+            f"CREATE TEMP TABLE {STAGING_TABLE} "
+            "(LIKE career_nodes INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            columns=STAGING_COLUMNS,
+            records=[
+                (
+                    row["id"],
+                    json.dumps(row["title"]),
+                    row["rank_required"],
+                    row["type"],
+                    json.dumps(row["metadata_"])
+                )
+                for row in rows
+            ]
+        )
+
+        staging = table(STAGING_TABLE, *(column(name) for name in STAGING_COLUMNS))
+        stmt = insert(CareerNode).from_select(
+            [CareerNode.id, CareerNode.title, CareerNode.rank_required, CareerNode.type, CareerNode.metadata_],
+            select(*staging.c)
+        )
+        await db.execute(_upsert(stmt))
@@ -13,9 +13,12 @@ Docker:
 import asyncio
 import argparse
 import logging
-from typing import List, Type
+from typing import Awaitable, List, Type
 
-from app.services.core.database import AsyncSessionLocal
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.core.database import AsyncSessionLocal, engine
 from database.seeders.base import BaseSeeder
 from database.seeders.badge_seeder import BadgeSeeder
 from database.seeders.career_node_seeder import CareerNodeSeeder
@@ -39,30 +42,64 @@ def get_seeder_by_name(name: str) -> Type[BaseSeeder] | None:
     return None
 
 
-async def run_seeder(seeder_cls: Type[BaseSeeder]) -> int:
-    """Run a single seeder."""
+async def _run_in_session(seeder_cls: Type[BaseSeeder], db: AsyncSession) -> int:
+    """Run a single seeder on an existing session without committing."""
     seeder = seeder_cls()
     
+    if not await seeder.should_run(db):
+        logger.info(f"⏭️  [{seeder.name}] Skipped (already seeded)")
+        return 0
+    
+    logger.info(f"🌱 [{seeder.name}] Running...")
+    return await seeder.run(db)
+
+
+async def run_seeder(seeder_cls: Type[BaseSeeder]) -> int:
+    """Run a single seeder in its own session and transaction."""
     async with AsyncSessionLocal() as db:
-        if not await seeder.should_run(db):
-            logger.info(f"⏭️  [{seeder.name}] Skipped (already seeded)")
-            return 0
-        
-        logger.info(f"🌱 [{seeder.name}] Running...")
-        count = await seeder.run(db)
+        count = await _run_in_session(seeder_cls, db)
+        await db.commit()
         return count
 
 
+async def run_all_seeders_in_session(db: AsyncSession) -> int:
+    """
+    Run all registered seeders sequentially on the caller's session.
+    
+    The caller owns the transaction. Every seeder issues its first statement
+    through the session, so everything lands in one commit.
+    
+    Returns:
+        Total number of records seeded.
+    """
+    total = 0
+    for seeder_cls in SEEDERS:
+        total += await _run_in_session(seeder_cls, db)
+    return total
+
+
 async def run_all_seeders():
-    """Run all registered seeders in order."""
+    """
+    Run all registered seeders concurrently.
+    
+    Seeders touch disjoint tables and each opens its own session, so their
+    DB round-trips can overlap.
+    """
     logger.info("=" * 50)
     logger.info("🌱 Running All Seeders")
     logger.info("=" * 50)
     
-    total = 0
-    for seeder_cls in SEEDERS:
-        count = await run_seeder(seeder_cls)
-        total += count
+    # Establish a pooled connection up front so the seeders don't all
+    # race to open their first one (pool_size defaults to 5 >= len(SEEDERS))
+    async with AsyncSessionLocal() as warm:
+        await warm.execute(text("SELECT 1"))
+    
+    counts = await asyncio.gather(*(run_seeder(seeder_cls) for seeder_cls in SEEDERS))
+    results = sorted(zip((seeder_cls.name for seeder_cls in SEEDERS), counts))
+    
+    for name, count in results:
+        logger.info(f"   [{name}] {count} records")
+    total = sum(counts)
     
     logger.info("=" * 50)
     logger.info(f"✅ Seeding complete! Total records: {total}")
@@ -89,6 +126,14 @@ async def run_specific_seeders(names: List[str]):
     logger.info("=" * 50)
 
 
+async def _run_and_dispose(coro: Awaitable[None]):
+    """Await a runner coroutine, then close the engine's pooled connections."""
+    try:
+        await coro
+    finally:
+        await engine.dispose()
+
+
 def list_seeders():
     """List all available seeders."""
     print("\n📋 Available Seeders:")
@@ -127,9 +172,9 @@ Examples:
         return
     
     if args.seeders:
-        asyncio.run(run_specific_seeders(args.seeders))
+        asyncio.run(_run_and_dispose(run_specific_seeders(args.seeders)))
     else:
-        asyncio.run(run_all_seeders())
+        asyncio.run(_run_and_dispose(run_all_seeders()))
 
 
 if __name__ == "__main__":
@@ -4,12 +4,18 @@ FastAPI application entry point.
 Uses centralized config from config package.
 """
 import logging
-from fastapi import FastAPI, Request
+from typing import Any
+
+import orjson
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import text
 
 from app.controllers import upload, interviews, utils, applications, test_tts, practice, gamification
 from app.middleware.rate_limit import setup_rate_limiting
+from app.services.core.database import AsyncSessionLocal
+from app.services.core.exceptions import AppException
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -17,6 +23,21 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+# CORS origins cannot change at runtime; a frozenset gives O(1) lookups in error handlers
+_ALLOWED_ORIGINS = frozenset(settings.cors_origins_list)
+
+# Body of every unhandled-error response, serialized once at import
+_ERROR_500_BYTES = orjson.dumps({"error": "Internal server error", "detail": "An unexpected error occurred"})
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        # Non-str keys are stringified, as json.dumps does
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Mock Interviewer API",
@@ -37,15 +58,12 @@ setup_rate_limiting(app)
 
 
 # Custom exception handler for AppException
-from app.services.core.exceptions import AppException
-
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
     """Handle custom application exceptions with structured response."""
     origin = request.headers.get("origin", "")
-    allowed_origins = settings.cors_origins_list
     
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.code,
@@ -54,7 +72,7 @@ async def app_exception_handler(request: Request, exc: AppException):
         }
     )
     
-    if origin in allowed_origins:
+    if origin in _ALLOWED_ORIGINS:
         response.headers["Access-Control-Allow-Origin"] = origin
         response.headers["Access-Control-Allow-Credentials"] = "true"
     
@@ -68,14 +86,14 @@ async def global_exception_handler(request: Request, exc: Exception):
     logger.exception(f"Unhandled error on {request.url.path}: {exc}")
     
     origin = request.headers.get("origin", "")
-    allowed_origins = settings.cors_origins_list
     
-    response = JSONResponse(
+    response = Response(
+        content=_ERROR_500_BYTES,
         status_code=500,
-        content={"error": "Internal server error", "detail": "An unexpected error occurred"}
+        media_type="application/json"
     )
     
-    if origin in allowed_origins:
+    if origin in _ALLOWED_ORIGINS:
         response.headers["Access-Control-Allow-Origin"] = origin
         response.headers["Access-Control-Allow-Credentials"] = "true"
     
@@ -88,26 +106,23 @@ app.include_router(api_router, prefix="/api/v1")
 
 
 # Health check endpoints
-@app.get("/")
+# These return plain dicts (no response_model), so orjson is set per route.
+# The app default stays FastAPI's, which lets response_model routes
+# serialize straight to bytes via Pydantic.
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint with version info."""
     return {"message": "AI Mock Interviewer API", "version": "1.0.0"}
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Basic liveness probe."""
     return {"status": "ok"}
 
 
-@app.get("/health/ready")
-async def readiness_check():
-    """
-    Readiness probe - checks database connectivity.
-    """
-    from app.services.core.database import AsyncSessionLocal
-    from sqlalchemy import text
-    
+async def get_db_healthcheck() -> dict:
+    """Ping the database and report readiness checks."""
     checks = {
         "database": "unknown",
         "status": "ok"
@@ -123,3 +138,11 @@ async def readiness_check():
         logger.error(f"Readiness check failed - DB: {e}")
     
     return checks
+
+
+@app.get("/health/ready", response_class=ORJSONResponse)
+async def readiness_check(checks: dict = Depends(get_db_healthcheck)):
+    """
+    Readiness probe - checks database connectivity.
+    """
+    return checks
@@ -7,9 +7,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import logging
 import argparse
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.core.database import AsyncSessionLocal
-from database.seeders.runner import run_all_seeders
+from database.seeders.runner import run_all_seeders_in_session
 from alembic.config import Config
 from alembic import command
 
@@ -17,30 +17,32 @@ from alembic import command
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger("db_fresh")
 
-async def drop_all_tables():
-    """Drop all tables in the database."""
+# Pure SQL drop cascade is safer than toggling foreign key checks.
+# The alembic_version table works around an asyncpg/alembic issue on fresh DBs.
+DROP_SCHEMA_SQL = """
+DROP SCHEMA public CASCADE;
+CREATE SCHEMA public;
+GRANT ALL ON SCHEMA public TO postgres;
+GRANT ALL ON SCHEMA public TO public;
+CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY);
+"""
+
+async def drop_all_tables(session: AsyncSession):
+    """Drop all tables in the database on the caller's session connection."""
     logger.info("🗑️  Dropping all tables...")
-    async with AsyncSessionLocal() as session:
-        # Disable foreign key checks temporarily if needed, 
-        # but pure SQL execute is safer for drop cascade
-        await session.execute(text("DROP SCHEMA public CASCADE;"))
-        await session.execute(text("CREATE SCHEMA public;"))
-        await session.execute(text("GRANT ALL ON SCHEMA public TO postgres;"))
-        await session.execute(text("GRANT ALL ON SCHEMA public TO public;"))
-        # Workaround for asyncpg/alembic issue on fresh DB
-        await session.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY);"))
-        await session.commit()
+    # Send the whole script on the session's connection through asyncpg's
+    # simple-query protocol: one round-trip, and Postgres runs the
+    # multi-statement message as a single all-or-nothing transaction
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.execute(DROP_SCHEMA_SQL)
     logger.info("✅ All tables dropped & prepared.")
 
 def run_migrations():
     """Run alembic migrations."""
     logger.info("🔄 Running migrations...")
-import subprocess
-
-def run_migrations():
-    """Run alembic migrations."""
-    logger.info("🔄 Running migrations...")
-    subprocess.run(["alembic", "upgrade", "head"], check=True)
+    cfg = Config("alembic.ini")
+    command.upgrade(cfg, "head")
     logger.info("✅ Migrations complete.")
 
 async def main():
@@ -48,16 +50,20 @@ async def main():
     parser.add_argument("--seed", action="store_true", help="Run seeders after fresh")
     args = parser.parse_args()
 
-    # 1. Drop All
-    await drop_all_tables()
+    # 1. Drop All (committed before alembic opens its own connection)
+    async with AsyncSessionLocal() as session, session.begin():
+        await drop_all_tables(session)
     
     # 2. Migrate
-    # Alembic commands are synchronous
-    run_migrations()
+    # Alembic commands are synchronous, and env.py starts its own event
+    # loop, so run them off this loop's thread
+    await asyncio.to_thread(run_migrations)
     
     # 3. Seed (optional)
     if args.seed:
-        await run_all_seeders()
+        async with AsyncSessionLocal() as session, session.begin():
+            total = await run_all_seeders_in_session(session)
+        logger.info(f"✅ Seeded {total} records.")
 
 if __name__ == "__main__":
     asyncio.run(main())
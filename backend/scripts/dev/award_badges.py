@@ -18,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from app.services.core.database import AsyncSessionLocal
 from app.models.gamification import UserAchievement, Achievement
+from database.seeders.base import existing_ids
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 
@@ -25,31 +26,31 @@ from sqlalchemy.dialects.postgresql import insert
 async def get_all_badge_ids():
     """Get all available badge IDs from database."""
     async with AsyncSessionLocal() as db:
-        result = await db.execute(select(Achievement.id))
-        return [row[0] for row in result.fetchall()]
+        return (await db.execute(select(Achievement.id))).scalars().all()
 
 
 async def award_badges(user_id: str, badge_ids: list):
     """Award badges to a user."""
     async with AsyncSessionLocal() as db:
-        for badge_id in badge_ids:
-            # Check if badge exists
-            badge_check = await db.execute(
-                select(Achievement).where(Achievement.id == badge_id)
-            )
-            if not badge_check.scalar_one_or_none():
-                print(f"⚠️  Badge '{badge_id}' not found, skipping")
-                continue
-            
-            # Upsert user achievement
-            stmt = insert(UserAchievement).values(
-                user_id=user_id,
-                achievement_id=badge_id
-            )
+        # Validate all badge ids in one query
+        valid = await existing_ids(db, Achievement, badge_ids)
+
+        skipped = [bid for bid in badge_ids if bid not in valid]
+        if skipped:
+            print(f"⚠️  Badges not found, skipping: {', '.join(skipped)}")
+
+        awarded = [bid for bid in dict.fromkeys(badge_ids) if bid in valid]
+        if awarded:
+            # Upsert all user achievements in one statement
+            stmt = insert(UserAchievement).values([
+                {"user_id": user_id, "achievement_id": bid}
+                for bid in awarded
+            ])
             stmt = stmt.on_conflict_do_nothing()
             await db.execute(stmt)
-            print(f"🏅 Awarded: {badge_id}")
-        
+            for bid in awarded:
+                print(f"🏅 Awarded: {bid}")
+
         await db.commit()
         print(f"\n✅ Done! Awarded badges to {user_id}")
 
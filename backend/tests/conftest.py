@@ -1,36 +1,15 @@
 """
 Test fixtures and configuration for backend tests
 """
-import sys
-import os
-
-# Add project root to python path to allow importing main and app modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import importlib
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from main import app
-
-
-@pytest.fixture
-async def client():
-    """Create async test client for API testing"""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
 
 
-@pytest.fixture
-def sample_job_role():
-    """Sample job role for testing"""
-    return "Senior Software Engineer"
-
-
-@pytest.fixture
-def sample_pdf_content():
-    """Minimal valid PDF content for testing"""
-    # This is a minimal valid PDF structure
-    return b"""%PDF-1.4
+# Minimal valid PDF structure, built once for the whole session
+_SAMPLE_PDF = b"""%PDF-1.4
 1 0 obj
 << /Type /Catalog /Pages 2 0 R >>
 endobj
@@ -51,3 +30,51 @@ trailer
 startxref
 191
 %%EOF"""
+
+APP_FIXTURES = {"client"}
+
+
+def pytest_collection_finish(session):
+    """Import main up front only when a collected test needs the app"""
+    if any(APP_FIXTURES.intersection(getattr(item, "fixturenames", ())) for item in session.items):
+        importlib.import_module("main")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    Async test client shared by the whole session.
+
+    App startup (lifespan) and transport setup run once, on the session
+    event loop that pytest.ini makes the default for tests.
+    """
+    # Imported here so tests that never use the app skip the main import graph
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture
+def sample_job_role():
+    """Sample job role for testing"""
+    return "Senior Software Engineer"
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_content():
+    """Minimal valid PDF content for testing (wrap in io.BytesIO for a file object)"""
+    return _SAMPLE_PDF
+
+
+def _assert_committed_once(db):
+    """Check the session mock's commit was awaited exactly once"""
+    assert db.commit.await_count == 1, f"commit awaited {db.commit.await_count} times"
+
+
+@pytest.fixture(scope="session")
+def assert_committed_once():
+    """Shared checker for tests that expect exactly one commit"""
+    return _assert_committed_once
@@ -1,30 +1,58 @@
 """
 Tests for API endpoints - Health checks and core functionality
 """
+import asyncio
+
 import pytest
 
 
+@pytest.fixture(scope="class")
+def stub_db_healthcheck():
+    """Answer readiness without touching the database (removed after the class)"""
+    from main import app, get_db_healthcheck
+
+    app.dependency_overrides[get_db_healthcheck] = lambda: {"database": "ok", "status": "ok"}
+    yield
+    app.dependency_overrides.pop(get_db_healthcheck, None)
+
+
+@pytest.mark.usefixtures("stub_db_healthcheck")
 class TestHealthEndpoints:
     """Test health check endpoints"""
     
-    @pytest.mark.asyncio
-    async def test_root_endpoint(self, client):
-        """Test root endpoint returns welcome message"""
-        response = await client.get("/")
-        assert response.status_code == 200
-        data = response.json()
+    async def test_health_smoke(self, client):
+        """Root, liveness, readiness and rate-limited routes answer concurrently"""
+        root, liveness, rate_limited, readiness = await asyncio.gather(
+            client.get("/"),
+            client.get("/health"),
+            client.get("/health"),
+            client.get("/health/ready"),
+        )
+        
+        # Root endpoint returns welcome message
+        assert root.status_code == 200
+        data = root.json()
         assert "message" in data
         assert "version" in data
+        
+        # Basic health/liveness probe
+        assert liveness.status_code == 200
+        assert liveness.json()["status"] == "ok"
+        
+        # Rate limiting middleware lets normal traffic through
+        assert rate_limited.status_code == 200
+        
+        # Readiness probe checks database
+        assert readiness.status_code == 200
+        data = readiness.json()
+        assert "database" in data
+        assert "status" in data
+
+
+@pytest.mark.integration
+class TestHealthIntegration:
+    """Health checks against the real database"""
     
-    @pytest.mark.asyncio
-    async def test_health_liveness(self, client):
-        """Test basic health/liveness probe"""
-        response = await client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-    
-    @pytest.mark.asyncio
     async def test_health_readiness(self, client):
         """Test readiness probe checks database"""
         response = await client.get("/health/ready")
@@ -37,13 +65,11 @@ class TestHealthEndpoints:
 class TestUploadValidation:
     """Test file upload validation"""
     
-    @pytest.mark.asyncio
     async def test_upload_rejects_non_pdf(self, client):
         """Test that non-PDF files are rejected"""
         # This would need auth mocking - placeholder for now
         pass
     
-    @pytest.mark.asyncio
     async def test_upload_requires_auth(self, client):
         """Test upload endpoint requires authentication"""
         response = await client.post(
@@ -51,14 +77,3 @@ class TestUploadValidation:
             data={"job_role": "Engineer"}
         )
         assert response.status_code == 401
-
-
-class TestRateLimiting:
-    """Test rate limiting functionality"""
-    
-    @pytest.mark.asyncio
-    async def test_rate_limit_headers(self, client):
-        """Test that rate limit headers are present"""
-        response = await client.get("/health")
-        # Rate limiting should add headers
-        assert response.status_code == 200
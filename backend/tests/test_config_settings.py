@@ -5,38 +5,40 @@ import os
 import pytest
 from unittest.mock import patch
 
+from pydantic import ValidationError
+
+from config.settings import Settings, get_settings
+
+
+@pytest.fixture(scope="session")
+def default_settings():
+    """Default Settings instance shared by read-only assertions."""
+    return Settings()
+
 
 class TestSettings:
     """Tests for Settings class."""
     
-    def test_default_database_url(self):
+    def test_default_database_url(self, default_settings):
         """Should have default database URL."""
-        from config.settings import Settings
-        settings = Settings()
-        assert "postgresql" in settings.DATABASE_URL
+        assert "postgresql" in default_settings.DATABASE_URL
     
-    def test_default_gemini_model(self):
+    def test_default_gemini_model(self, default_settings):
         """Should default to Gemini 2.5 Flash."""
-        from config.settings import Settings
-        settings = Settings()
-        assert settings.GEMINI_MODEL == "models/gemini-2.5-flash"
+        assert default_settings.GEMINI_MODEL == "models/gemini-2.5-flash"
     
-    def test_default_rate_limit(self):
+    def test_default_rate_limit(self, default_settings):
         """Should have default rate limit."""
-        from config.settings import Settings
-        settings = Settings()
-        assert settings.RATE_LIMIT == "100/minute"
+        assert default_settings.RATE_LIMIT == "100/minute"
     
     def test_cors_origins_list_empty_returns_defaults(self):
         """Empty CORS_ORIGINS should return default origins."""
-        from config.settings import Settings
         settings = Settings(CORS_ORIGINS="")
         origins = settings.cors_origins_list
         assert "http://localhost:3000" in origins
     
     def test_cors_origins_list_parses_comma_separated(self):
         """Should parse comma-separated CORS origins."""
-        from config.settings import Settings
         settings = Settings(CORS_ORIGINS="http://a.com, http://b.com")
         origins = settings.cors_origins_list
         assert "http://a.com" in origins
@@ -44,23 +46,32 @@ class TestSettings:
     
     def test_clerk_jwks_url_derived_from_issuer(self):
         """Should derive JWKS URL from Clerk issuer."""
-        from config.settings import Settings
         settings = Settings(CLERK_ISSUER="https://test.clerk.accounts.dev")
         assert settings.clerk_jwks_url == "https://test.clerk.accounts.dev/.well-known/jwks.json"
 
+    def test_derived_properties_are_cached(self):
+        """Derived properties should be computed once per instance."""
+        settings = Settings(CORS_ORIGINS="http://a.com")
+        assert settings.cors_origins_list is settings.cors_origins_list
+        assert settings.clerk_jwks_url is settings.clerk_jwks_url
+
+    def test_settings_are_frozen(self):
+        """Settings should reject mutation so the cached instance is safe to share."""
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.RATE_LIMIT = "1/minute"
+
 
 class TestGetSettings:
     """Tests for get_settings function."""
     
     def test_returns_settings_instance(self):
         """Should return a Settings instance."""
-        from config.settings import get_settings, Settings
         settings = get_settings()
         assert isinstance(settings, Settings)
     
     def test_is_cached(self):
         """Should return same cached instance."""
-        from config.settings import get_settings
         settings1 = get_settings()
         settings2 = get_settings()
         assert settings1 is settings2
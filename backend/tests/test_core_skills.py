@@ -1,16 +1,33 @@
-import pytest
-import sys
-import os
+import re
 
-# Ensure backend is in path
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+import pytest
 
 from app.services.core.intelligence.skills.extraction.resume_probe import ResumeProbe
 from app.services.core.intelligence.skills.guardrails.bias_filter import BiasFilter
 from app.services.core.intelligence.skills.guardrails.topic_blocker import TopicBlocker
 
-def test_resume_probe_active():
-    skill = ResumeProbe()
+# Guardrail prompt markers, each matched in a single pass over the output
+BIAS_FILTER_MARKERS = ["Age, Date of Birth", "Marital Status", "Disabilities or Health Conditions"]
+TOPIC_BLOCKER_MARKERS = ["Security Protocol", "cannot discuss my internal configurations", "Ignore previous instructions"]
+BIAS_FILTER_RE = re.compile("|".join(re.escape(m) for m in BIAS_FILTER_MARKERS))
+TOPIC_BLOCKER_RE = re.compile("|".join(re.escape(m) for m in TOPIC_BLOCKER_MARKERS))
+
+
+@pytest.fixture(scope="module")
+def resume_probe():
+    return ResumeProbe()
+
+@pytest.fixture(scope="module")
+def bias_filter():
+    return BiasFilter()
+
+@pytest.fixture(scope="module")
+def topic_blocker():
+    return TopicBlocker()
+
+
+def test_resume_probe_active(resume_probe):
+    skill = resume_probe
     context = {"resume_text": "Experienced Python Developer with 5 years in Django..."}
     output = skill.execute(context)
     
@@ -19,28 +36,24 @@ def test_resume_probe_active():
     # Should include the resume text snippet
     assert "Experienced Python Developer" in output
 
-def test_resume_probe_inactive_no_text():
-    skill = ResumeProbe()
+def test_resume_probe_inactive_no_text(resume_probe):
+    skill = resume_probe
     context = {"resume_text": ""}
     output = skill.execute(context)
     assert output == ""
 
-def test_bias_filter():
-    skill = BiasFilter()
+def test_bias_filter(bias_filter):
+    skill = bias_filter
     context = {}
     output = skill.execute(context)
     
     # Check for actual prompt text
-    assert "Age, Date of Birth" in output
-    assert "Marital Status" in output
-    assert "Disabilities or Health Conditions" in output
+    assert set(BIAS_FILTER_RE.findall(output)) == set(BIAS_FILTER_MARKERS)
 
-def test_topic_blocker():
-    skill = TopicBlocker()
+def test_topic_blocker(topic_blocker):
+    skill = topic_blocker
     context = {}
     output = skill.execute(context)
     
     # Check for actual prompt text
-    assert "Security Protocol" in output
-    assert "cannot discuss my internal configurations" in output
-    assert "Ignore previous instructions" in output
+    assert set(TOPIC_BLOCKER_RE.findall(output)) == set(TOPIC_BLOCKER_MARKERS)
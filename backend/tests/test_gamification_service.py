@@ -6,55 +6,71 @@ Tests for:
 - Badge awarding logic  
 - XP/Level calculations
 - Node completion flow
+
+Assertions here are plain integer/boolean checks, so pytest's assertion
+rewriting is skipped for this module: PYTEST_DONT_REWRITE
 """
 import pytest
+from collections import namedtuple
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
+from app.services.core.gamification.gamification_service import (
+    badge_earned,
+    compute_new_streak,
+    count_high_scores,
+    update_skill_stats,
+)
 
-# ===== Mock Fixtures =====
 
-@pytest.fixture
-def mock_db():
-    """Create a mock async database session."""
-    db = AsyncMock()
-    db.execute = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.flush = AsyncMock()
-    return db
+# Plain attribute carrier for completed node scores
+Node = namedtuple("Node", "high_score")
+
+# badge_earned keyword fed by each criteria type
+STAT_FOR_CRITERIA = {
+    "interview_count": "interview_count",
+    "interview_score": "score",
+    "level": "level",
+    "daily_streak": "daily_streak",
+    "high_score_count": "high_score_count",
+}
+
+# Pinned clock so day-boundary comparisons are deterministic
+FIXED_NOW = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
 
 
+# ===== Mock Fixtures =====
+
 @pytest.fixture
 def mock_user_progress():
-    """Create a mock UserProgress object."""
-    progress = MagicMock()
-    progress.user_id = "user_test123"
-    progress.current_level = 1
-    progress.current_xp = 0
-    progress.daily_streak = 0
-    progress.last_active_at = None
-    progress.skill_stats = {
-        "coding_standards": 50,
-        "system_design": 50,
-        "algorithms": 50,
-        "communication": 50,
-        "tech_proficiency": 50,
-        "debugging": 50
-    }
-    return progress
+    """Create a stand-in UserProgress object."""
+    return SimpleNamespace(
+        user_id="user_test123",
+        current_level=1,
+        current_xp=0,
+        daily_streak=0,
+        last_active_at=None,
+        skill_stats={
+            "coding_standards": 50,
+            "system_design": 50,
+            "algorithms": 50,
+            "communication": 50,
+            "tech_proficiency": 50,
+            "debugging": 50
+        }
+    )
 
 
 @pytest.fixture
 def mock_user_node():
-    """Create a mock UserNode object."""
-    node = MagicMock()
-    node.user_id = "user_test123"
-    node.node_id = "node_test"
-    node.status = "unlocked"
-    node.high_score = 0
-    node.completed_at = None
-    return node
+    """Create a stand-in UserNode object."""
+    return SimpleNamespace(
+        user_id="user_test123",
+        node_id="node_test",
+        status="unlocked",
+        high_score=0,
+        completed_at=None
+    )
 
 
 # ===== Daily Streak Tests =====
@@ -62,86 +78,18 @@ def mock_user_node():
 class TestDailyStreakLogic:
     """Tests for daily streak tracking in complete_node."""
     
-    def test_streak_unchanged_if_already_active_today(self, mock_user_progress):
-        """Streak should not change if user already active today."""
-        # Setup: last_active_at is today
-        now = datetime.now(timezone.utc)
-        mock_user_progress.last_active_at = now
-        mock_user_progress.daily_streak = 5
-        
-        today = now.date()
-        last_active = mock_user_progress.last_active_at.date()
-        
-        # Logic from complete_node
-        if last_active == today:
-            new_streak = mock_user_progress.daily_streak  # unchanged
-        elif last_active == today - timedelta(days=1):
-            new_streak = mock_user_progress.daily_streak + 1
-        else:
-            new_streak = 1
-        
-        assert new_streak == 5  # Unchanged
-    
-    def test_streak_increments_on_consecutive_day(self, mock_user_progress):
-        """Streak should increment if last active was yesterday."""
-        # Setup: last_active_at is yesterday
-        now = datetime.now(timezone.utc)
-        yesterday = now - timedelta(days=1)
-        mock_user_progress.last_active_at = yesterday
-        mock_user_progress.daily_streak = 3
-        
-        today = now.date()
-        last_active = mock_user_progress.last_active_at.date()
-        
-        # Logic from complete_node
-        if last_active == today:
-            new_streak = mock_user_progress.daily_streak
-        elif last_active == today - timedelta(days=1):
-            new_streak = mock_user_progress.daily_streak + 1
-        else:
-            new_streak = 1
-        
-        assert new_streak == 4  # Incremented
-    
-    def test_streak_resets_if_gap_of_two_days(self, mock_user_progress):
-        """Streak should reset to 1 if more than 1 day gap."""
-        # Setup: last_active_at is 2 days ago
-        now = datetime.now(timezone.utc)
-        two_days_ago = now - timedelta(days=2)
-        mock_user_progress.last_active_at = two_days_ago
-        mock_user_progress.daily_streak = 10
-        
-        today = now.date()
-        last_active = mock_user_progress.last_active_at.date()
-        
-        # Logic from complete_node
-        if last_active == today:
-            new_streak = mock_user_progress.daily_streak
-        elif last_active == today - timedelta(days=1):
-            new_streak = mock_user_progress.daily_streak + 1
-        else:
-            new_streak = 1
+    @pytest.mark.parametrize("delta_days,initial_streak,expected", [
+        (0, 5, 5),      # Already active today: unchanged
+        (1, 3, 4),      # Active yesterday: incremented
+        (2, 10, 1),     # Gap of two days: reset
+        (None, 0, 1),   # First ever activity: starts at 1
+    ])
+    def test_streak_transition(self, delta_days, initial_streak, expected):
+        """Streak should hold, increment, reset or start depending on last activity."""
+        today = FIXED_NOW.date()
+        last_active = None if delta_days is None else (FIXED_NOW - timedelta(days=delta_days)).date()
         
-        assert new_streak == 1  # Reset
-    
-    def test_streak_starts_at_1_for_first_activity(self, mock_user_progress):
-        """Streak should start at 1 for first ever activity."""
-        # Setup: never active before
-        mock_user_progress.last_active_at = None
-        mock_user_progress.daily_streak = 0
-        
-        today = datetime.now(timezone.utc).date()
-        last_active = None
-        
-        # Logic from complete_node
-        if last_active == today:
-            new_streak = mock_user_progress.daily_streak
-        elif last_active and last_active == today - timedelta(days=1):
-            new_streak = mock_user_progress.daily_streak + 1
-        else:
-            new_streak = 1
-        
-        assert new_streak == 1  # First activity
+        assert compute_new_streak(last_active, today, initial_streak) == expected
 
 
 # ===== XP & Level Calculation Tests =====
@@ -185,74 +133,48 @@ class TestXPAndLevelCalculation:
 class TestBadgeAwardingLogic:
     """Tests for badge criteria checking."""
     
-    def test_first_step_badge_criteria(self):
-        """First Step badge should unlock after 1 interview."""
-        criteria = {"type": "interview_count", "min": 1}
-        interview_count = 1
-        
-        earned = interview_count >= criteria.get("min", 1)
-        assert earned is True
-    
-    def test_first_step_badge_not_earned_with_zero(self):
-        """First Step badge should NOT unlock with 0 interviews."""
-        criteria = {"type": "interview_count", "min": 1}
-        interview_count = 0
-        
-        earned = interview_count >= criteria.get("min", 1)
-        assert earned is False
-    
-    def test_perfectionist_badge_criteria(self):
-        """Perfectionist badge should unlock with score >= 90."""
-        criteria = {"type": "interview_score", "min": 90}
-        
-        # Score of 90 should earn badge
-        assert 90 >= criteria.get("min", 90)
-        
-        # Score of 89 should not
-        assert not (89 >= criteria.get("min", 90))
-    
-    def test_expert_badge_needs_10_interviews(self):
-        """Expert badge should require 10 completed interviews."""
-        criteria = {"type": "interview_count", "min": 10}
-        
-        assert 10 >= criteria.get("min", 10)  # Earned
-        assert not (9 >= criteria.get("min", 10))  # Not earned
-    
-    def test_streak_master_badge_criteria(self):
-        """Streak Master badge should unlock with 3-day streak."""
-        criteria = {"type": "daily_streak", "min": 3}
-        
-        assert 3 >= criteria.get("min", 3)  # Earned
-        assert not (2 >= criteria.get("min", 3))  # Not earned
-    
-    def test_level_badge_criteria(self):
-        """Guru badge should unlock at level 5."""
-        criteria = {"type": "level", "min": 5}
-        
-        assert 5 >= criteria.get("min", 5)  # Earned at level 5
-        assert 6 >= criteria.get("min", 5)  # Earned at level 6
-        assert not (4 >= criteria.get("min", 5))  # Not earned at level 4
+    @pytest.mark.parametrize("criteria,value,expected", [
+        ({"type": "interview_count", "min": 1}, 1, True),     # First Step
+        ({"type": "interview_count", "min": 1}, 0, False),
+        ({"type": "interview_score", "min": 90}, 90, True),   # Perfectionist
+        ({"type": "interview_score", "min": 90}, 89, False),
+        ({"type": "interview_count", "min": 10}, 10, True),   # Expert
+        ({"type": "interview_count", "min": 10}, 9, False),
+        ({"type": "daily_streak", "min": 3}, 3, True),        # Streak Master
+        ({"type": "daily_streak", "min": 3}, 2, False),
+        ({"type": "level", "min": 5}, 5, True),               # Guru
+        ({"type": "level", "min": 5}, 6, True),
+        ({"type": "level", "min": 5}, 4, False),
+    ])
+    def test_min_threshold_criteria(self, criteria, value, expected):
+        """Badges with a min criterion should unlock once the value reaches it."""
+        stats = dict.fromkeys(STAT_FOR_CRITERIA.values(), 0)
+        stats[STAT_FOR_CRITERIA[criteria["type"]]] = value
+        assert badge_earned(criteria, **stats) is expected
     
     def test_elite_badge_high_score_count(self):
         """Elite badge should unlock with 3 scores of 95+."""
         criteria = {"type": "high_score_count", "min_score": 95, "min_count": 3}
         
-        # Mock completed nodes with high scores
+        # Completed nodes with high scores
         completed_nodes = [
-            MagicMock(high_score=95),
-            MagicMock(high_score=98),
-            MagicMock(high_score=100),
-            MagicMock(high_score=80),  # This one doesn't count
+            Node(95),
+            Node(98),
+            Node(100),
+            Node(80),  # This one doesn't count
         ]
         
-        high_score_count = sum(
-            1 for n in completed_nodes 
-            if (n.high_score or 0) >= criteria.get("min_score", 95)
-        )
+        high_score_count = count_high_scores(completed_nodes)
         
-        earned = high_score_count >= criteria.get("min_count", 3)
-        assert earned is True
         assert high_score_count == 3
+        assert badge_earned(
+            criteria,
+            interview_count=len(completed_nodes),
+            score=0,
+            level=1,
+            daily_streak=0,
+            high_score_count=high_score_count
+        ) is True
 
 
 # ===== Skill Stats Update Tests =====
@@ -274,18 +196,14 @@ class TestSkillStatsUpdate:
     
     def test_stats_improve_with_high_scores(self):
         """Stats should improve when new session scores higher."""
-        alpha = 0.3
         old_stats = {"coding_standards": 50, "algorithms": 50}
         new_metrics = {"coding_standards": 90, "algorithms": 70}
         
-        updated_stats = {}
-        for key in old_stats.keys():
-            old_val = old_stats.get(key, 50)
-            new_val = new_metrics.get(key, old_val)
-            updated_stats[key] = int((1 - alpha) * old_val + alpha * new_val)
+        updated_stats = update_skill_stats(old_stats, new_metrics)
         
         assert updated_stats["coding_standards"] == 62  # 0.7*50 + 0.3*90 = 62
         assert updated_stats["algorithms"] == 56  # 0.7*50 + 0.3*70 = 56
+        assert updated_stats["debugging"] == 50  # No new metric, old value kept
 
 
 if __name__ == "__main__":
@@ -8,9 +8,13 @@ Tests for:
 - CompetencyEvaluator
 - CrossStageMemory
 - QuestionGenerator
+
+Assertions here are plain value/membership checks, so pytest's assertion
+rewriting is skipped for this module: PYTEST_DONT_REWRITE
 """
+import re
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.core.intelligence.candidate_profile import (
     CandidateProfile,
@@ -26,7 +30,8 @@ from app.services.core.intelligence.difficulty_adapter import (
     DifficultyLevel,
     DifficultyState,
     DifficultyAdapter,
-    difficulty_adapter
+    difficulty_adapter,
+    validate_levels
 )
 from app.services.core.intelligence.competency_evaluator import (
     CompetencyEvaluator,
@@ -34,6 +39,64 @@ from app.services.core.intelligence.competency_evaluator import (
 )
 
 
+# ===== Expected Values =====
+
+_LEVELS = frozenset({"foundational", "intermediate", "advanced", "expert"})
+_HR_EXPECTED = frozenset({"communication", "professionalism"})
+_TECH_EXPECTED = frozenset({"technical_depth", "problem_solving"})
+_BEHAVIORAL_EXPECTED = frozenset({"leadership"})
+
+# Markers a fully populated profile context must contain, scanned in one pass
+_CONTEXT_MARKERS = frozenset({
+    "VERIFIED SKILLS", "Python", "GAPS TO PROBE", "Docker",
+    "STRENGTHS", "TOPICS COVERED", "PERFORMANCE", "improving"
+})
+_CONTEXT_MARKERS_RE = re.compile("|".join(map(re.escape, sorted(_CONTEXT_MARKERS))))
+
+
+# ===== Shared Fixtures =====
+
+@pytest.fixture(scope="module")
+def empty_profile():
+    """Read-only empty profile; tests that mutate should use fresh_profile."""
+    return CandidateProfile()
+
+
+@pytest.fixture
+def fresh_profile():
+    """New profile per test, safe to mutate."""
+    return CandidateProfile()
+
+
+@pytest.fixture(scope="session")
+def sample_turn_scores():
+    """Two system_design turns and one clarity turn."""
+    return (
+        {"turn": 1, "score": 80, "dimension": "system_design"},
+        {"turn": 2, "score": 70, "dimension": "system_design"},
+        {"turn": 3, "score": 90, "dimension": "clarity"},
+    )
+
+
+@pytest.fixture(scope="session")
+def sw_engineer_weights():
+    return competency_evaluator.get_role_weights("Software Engineer")
+
+
+@pytest.fixture(scope="module")
+def adapter_factory():
+    """Build DifficultyAdapters, sharing one instance per distinct config (adapters are stateless)."""
+    cache = {}
+
+    def make(**kwargs):
+        key = frozenset(kwargs.items())
+        if key not in cache:
+            cache[key] = DifficultyAdapter(**kwargs)
+        return cache[key]
+
+    return make
+
+
 class TestCandidateProfile:
     """Tests for CandidateProfile dataclass."""
 
@@ -61,6 +124,12 @@ class TestCandidateProfile:
         assert "Strong backend" in data["strengths"]
         assert "python" in data["topics_covered"]
 
+        # Snapshot is detached from the live profile
+        data["verified_skills"]["Python"]["depth"] = 1
+        data["strengths"].append("other")
+        assert profile.verified_skills["Python"]["depth"] == 4
+        assert profile.strengths == ["Strong backend"]
+
     def test_profile_from_dict(self):
         """Should create profile from dictionary."""
         data = {
@@ -79,6 +148,20 @@ class TestCandidateProfile:
         assert "python" in profile.topics_covered
         assert profile.current_turn == 5
 
+    def test_freeze_topics_caches_sorted_order(self):
+        """Frozen topics should keep a cached sorted order until a topic is added."""
+        profile = CandidateProfile()
+        profile.add_topic("python")
+        profile.add_topic("career")
+        profile.freeze_topics()
+
+        assert isinstance(profile.topics_covered, frozenset)
+        assert profile.topics_sorted == ("career", "python")
+        assert profile.topics_sorted is profile.topics_sorted
+
+        profile.add_topic("apis")
+        assert profile.topics_sorted == ("apis", "career", "python")
+
     def test_profile_from_empty_dict(self):
         """Should handle empty dict gracefully."""
         profile = CandidateProfile.from_dict({})
@@ -94,15 +177,14 @@ class TestCandidateProfile:
 class TestCandidateProfileManager:
     """Tests for CandidateProfileManager."""
 
-    def test_to_context_string_empty_profile(self):
+    def test_to_context_string_empty_profile(self, empty_profile):
         """Should return empty string for empty profile."""
-        profile = CandidateProfile()
-        context = candidate_profile_manager.to_context_string(profile)
+        context = candidate_profile_manager.to_context_string(empty_profile)
         assert context == ""
 
-    def test_to_context_string_with_skills(self):
+    def test_to_context_string_with_skills(self, fresh_profile):
         """Should include verified skills in context."""
-        profile = CandidateProfile()
+        profile = fresh_profile
         profile.verified_skills = {
             "Python": {"depth": 4, "evidence": "test"},
             "SQL": {"depth": 2, "evidence": "weak"}
@@ -208,23 +290,11 @@ class TestDifficultyLevel:
 
     def test_all_levels_exist(self):
         """Should have all expected difficulty levels."""
-        levels = [l.value for l in DifficultyLevel]
-        assert "foundational" in levels
-        assert "intermediate" in levels
-        assert "advanced" in levels
-        assert "expert" in levels
+        assert _LEVELS.issubset({l.value for l in DifficultyLevel})
 
-    def test_level_descriptions(self):
-        """Should have descriptions for all levels."""
-        for level in DifficultyLevel:
-            assert level.description is not None
-            assert len(level.description) > 10
-
-    def test_level_question_guidance(self):
-        """Should have question guidance for all levels."""
-        for level in DifficultyLevel:
-            assert level.question_guidance is not None
-            assert len(level.question_guidance) > 20
+    def test_enum_invariants(self):
+        """Every level should have a description and question guidance."""
+        validate_levels()
 
 
 class TestDifficultyState:
@@ -267,6 +337,11 @@ class TestDifficultyState:
         assert state.level == DifficultyLevel.INTERMEDIATE
         assert state.turns_at_level == 0
 
+    def test_state_from_dict_rejects_unknown_level(self):
+        """Should fail loudly on a corrupt stored level."""
+        with pytest.raises(KeyError):
+            DifficultyState.from_dict({"level": "grandmaster"})
+
 
 class TestDifficultyAdapter:
     """Tests for DifficultyAdapter."""
@@ -290,20 +365,20 @@ class TestDifficultyAdapter:
         assert 75.0 in state.score_window
         assert state.turns_at_level == 1
 
-    def test_update_maintains_window_size(self):
+    def test_update_maintains_window_size(self, adapter_factory):
         """Should maintain window size limit."""
-        adapter = DifficultyAdapter(window_size=3)
+        adapter = adapter_factory(window_size=3)
         state = adapter.create_initial_state()
 
         for i, score in enumerate([60, 70, 80, 90, 95]):
             state = adapter.update(state, score, i + 1)
 
         assert len(state.score_window) == 3
-        assert state.score_window == [80, 90, 95]
+        assert list(state.score_window) == [80, 90, 95]
 
-    def test_no_change_below_min_turns(self):
+    def test_no_change_below_min_turns(self, adapter_factory):
         """Should not change difficulty below min turns."""
-        adapter = DifficultyAdapter(min_turns_at_level=3)
+        adapter = adapter_factory(min_turns_at_level=3)
         state = adapter.create_initial_state()
 
         # Add high scores but below min turns
@@ -312,13 +387,9 @@ class TestDifficultyAdapter:
 
         assert state.level == DifficultyLevel.INTERMEDIATE
 
-    def test_increase_on_high_scores(self):
+    def test_increase_on_high_scores(self, adapter_factory):
         """Should increase difficulty on consistently high scores."""
-        adapter = DifficultyAdapter(
-            increase_threshold=80,
-            min_turns_at_level=2,
-            window_size=3
-        )
+        adapter = adapter_factory(increase_threshold=80, min_turns_at_level=2, window_size=3)
         state = adapter.create_initial_state()
 
         # Add high scores above threshold
@@ -328,13 +399,9 @@ class TestDifficultyAdapter:
 
         assert state.level == DifficultyLevel.ADVANCED
 
-    def test_decrease_on_low_scores(self):
+    def test_decrease_on_low_scores(self, adapter_factory):
         """Should decrease difficulty on consistently low scores."""
-        adapter = DifficultyAdapter(
-            decrease_threshold=50,
-            min_turns_at_level=2,
-            window_size=3
-        )
+        adapter = adapter_factory(decrease_threshold=50, min_turns_at_level=2, window_size=3)
         state = adapter.create_initial_state()
 
         # Add low scores below threshold
@@ -344,6 +411,19 @@ class TestDifficultyAdapter:
 
         assert state.level == DifficultyLevel.FOUNDATIONAL
 
+    def test_update_batch_matches_sequential_updates(self, adapter_factory):
+        """update_batch should land on the same state as repeated update calls."""
+        adapter = adapter_factory(increase_threshold=80, min_turns_at_level=2, window_size=3)
+        scores = [85, 90, 92, 95, 40, 35, 30]
+
+        sequential = adapter.create_initial_state()
+        for turn, score in enumerate(scores, 1):
+            sequential = adapter.update(sequential, score, turn)
+
+        batched = adapter.update_batch(adapter.create_initial_state(), scores, 1)
+
+        assert batched.to_dict() == sequential.to_dict()
+
     def test_no_change_on_average_scores(self):
         """Should not change difficulty on average scores."""
         state = difficulty_adapter.create_initial_state()
@@ -354,11 +434,14 @@ class TestDifficultyAdapter:
 
         assert state.level == DifficultyLevel.INTERMEDIATE
 
-    def test_get_level_for_stage(self):
+    @pytest.mark.parametrize("stage,expected", [
+        ("hr", DifficultyLevel.INTERMEDIATE),
+        ("technical", DifficultyLevel.INTERMEDIATE),
+        ("practice", DifficultyLevel.FOUNDATIONAL),
+    ])
+    def test_get_level_for_stage(self, stage, expected):
         """Should return appropriate starting level for stage."""
-        assert difficulty_adapter.get_level_for_stage("hr") == DifficultyLevel.INTERMEDIATE
-        assert difficulty_adapter.get_level_for_stage("technical") == DifficultyLevel.INTERMEDIATE
-        assert difficulty_adapter.get_level_for_stage("practice") == DifficultyLevel.FOUNDATIONAL
+        assert difficulty_adapter.get_level_for_stage(stage) == expected
 
     def test_get_prompt_injection(self):
         """Should generate prompt injection text."""
@@ -389,29 +472,25 @@ class TestDifficultyAdapter:
 class TestCompetencyEvaluator:
     """Tests for CompetencyEvaluator."""
 
-    def test_map_dimension_to_competency(self):
+    @pytest.mark.parametrize("dimension,expected", [
+        ("system_design", "technical_depth"),
+        ("clarity", "communication"),
+        ("influence", "leadership"),
+        ("unknown", "general"),
+    ])
+    def test_map_dimension_to_competency(self, dimension, expected):
         """Should map dimensions to competencies correctly."""
-        assert competency_evaluator.map_dimension_to_competency("system_design") == "technical_depth"
-        assert competency_evaluator.map_dimension_to_competency("clarity") == "communication"
-        assert competency_evaluator.map_dimension_to_competency("influence") == "leadership"
-        assert competency_evaluator.map_dimension_to_competency("unknown") == "general"
+        assert competency_evaluator.map_dimension_to_competency(dimension) == expected
 
     def test_get_stage_focus(self):
         """Should return correct focus competencies for stages."""
-        hr_focus = competency_evaluator.get_stage_focus("hr")
-        assert "communication" in hr_focus
-        assert "professionalism" in hr_focus
+        assert _HR_EXPECTED.issubset(competency_evaluator.get_stage_focus("hr"))
+        assert _TECH_EXPECTED.issubset(competency_evaluator.get_stage_focus("technical"))
+        assert _BEHAVIORAL_EXPECTED.issubset(competency_evaluator.get_stage_focus("behavioral"))
 
-        tech_focus = competency_evaluator.get_stage_focus("technical")
-        assert "technical_depth" in tech_focus
-        assert "problem_solving" in tech_focus
-
-        behavioral_focus = competency_evaluator.get_stage_focus("behavioral")
-        assert "leadership" in behavioral_focus
-
-    def test_get_role_weights_exact_match(self):
+    def test_get_role_weights_exact_match(self, sw_engineer_weights):
         """Should return weights for exact role match."""
-        weights = competency_evaluator.get_role_weights("Software Engineer")
+        weights = sw_engineer_weights
         assert "technical_depth" in weights
         assert weights["technical_depth"] > 0
 
@@ -424,7 +503,8 @@ class TestCompetencyEvaluator:
         """Should return default weights for unknown role."""
         weights = competency_evaluator.get_role_weights("Unknown Role XYZ")
         assert "technical_depth" in weights
-        assert sum(weights.values()) == pytest.approx(1.0, 0.1)
+        assert weights.total == pytest.approx(1.0, 0.1)
+        assert weights.total == pytest.approx(sum(weights.values()))
 
     def test_get_rubric_level(self):
         """Should return correct rubric level descriptions."""
@@ -440,16 +520,10 @@ class TestCompetencyEvaluator:
         assert result["role_fit_score"] == 0
         assert result["competency_scores"] == {}
 
-    def test_compute_competency_scores(self):
+    def test_compute_competency_scores(self, sample_turn_scores):
         """Should compute competency scores correctly."""
-        turn_scores = [
-            {"turn": 1, "score": 80, "dimension": "system_design"},
-            {"turn": 2, "score": 70, "dimension": "system_design"},
-            {"turn": 3, "score": 90, "dimension": "clarity"},
-        ]
-
         result = competency_evaluator.compute_competency_scores(
-            turn_scores=turn_scores,
+            turn_scores=sample_turn_scores,
             job_role="Software Engineer"
         )
 
@@ -482,21 +556,15 @@ class TestIntegration:
         difficulty_state = difficulty_adapter.create_initial_state()
 
         # Simulate turns with scores
-        turn_scores = []
-        for i, score in enumerate([65, 70, 75, 80, 85]):
-            turn_scores.append({
-                "turn": i + 1,
-                "score": score,
-                "dimension": "system_design"
-            })
-
-            # Update difficulty
-            difficulty_state = difficulty_adapter.update(
-                difficulty_state, score, i + 1
-            )
-
-            # Update profile
-            profile.performance_trajectory.append(score)
+        scores = [65, 70, 75, 80, 85]
+        turn_scores = [
+            {"turn": i + 1, "score": score, "dimension": "system_design"}
+            for i, score in enumerate(scores)
+        ]
+        profile.performance_trajectory.extend(scores)
+
+        # Update difficulty (in place, same state object for the whole replay)
+        assert difficulty_adapter.update_batch(difficulty_state, scores, 1) is difficulty_state
 
         # Verify difficulty increased
         assert difficulty_state.level in [DifficultyLevel.ADVANCED, DifficultyLevel.INTERMEDIATE]
@@ -525,11 +593,4 @@ class TestIntegration:
         context = candidate_profile_manager.to_context_string(profile)
 
         # Verify all sections are present
-        assert "VERIFIED SKILLS" in context
-        assert "Python" in context
-        assert "GAPS TO PROBE" in context
-        assert "Docker" in context
-        assert "STRENGTHS" in context
-        assert "TOPICS COVERED" in context
-        assert "PERFORMANCE" in context
-        assert "improving" in context
+        assert set(_CONTEXT_MARKERS_RE.findall(context)) >= _CONTEXT_MARKERS
@@ -9,14 +9,32 @@ Tests for:
 """
 import pytest
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-from app.services.progress_service import ProgressService, DEFAULT_SKILL_DIMENSIONS
+from app.services.progress_service import (
+    ProgressService,
+    DEFAULT_SKILL_DIMENSIONS,
+    ROLE_TARGETS,
+    trend_direction
+)
+
+# Default dimensions as a set for membership checks
+_DIMS = frozenset(DEFAULT_SKILL_DIMENSIONS)
+
+# Fixed clock so date arithmetic in these tests is deterministic
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
 
 # ===== Mock Fixtures =====
 
+@pytest.fixture(scope="module")
+def frozen_now():
+    """Fixed "now" for date calculations."""
+    return FIXED_NOW
+
+
 @pytest.fixture
 def mock_db():
     """Create a mock async database session."""
@@ -29,6 +47,28 @@ def mock_db():
     return db
 
 
+@pytest.fixture(scope="module")
+def readonly_service():
+    """Shared ProgressService for tests that only call pure helper methods."""
+    return ProgressService(AsyncMock())
+
+
+# Fallback insight cases: (avg_score, trend), result field, keywords (any matches)
+FALLBACK_CASES = {
+    "excellent": ((85, None), "highlights", ("excellent",)),
+    "improvement": ((70, 10), "highlights", ("improvement", "up")),
+    "decline": ((65, -10), "recommendations", ("dipped", "review")),
+}
+
+
+@pytest.fixture(scope="module", params=list(FALLBACK_CASES))
+def fallback_result(request, readonly_service):
+    """Fallback insights computed once per case, as (messages, expected keywords)."""
+    (avg_score, trend), field, keywords = FALLBACK_CASES[request.param]
+    result = readonly_service._generate_fallback_insights(avg_score, {}, trend)
+    return result[field], keywords
+
+
 @pytest.fixture
 def mock_user_progress():
     """Create a mock UserProgress object."""
@@ -66,7 +106,7 @@ def mock_resolution():
     }
     resolution.target_date = datetime(2026, 12, 31, tzinfo=timezone.utc)
     resolution.status = "active"
-    resolution.created_at = datetime.now(timezone.utc)
+    resolution.created_at = FIXED_NOW
     return resolution
 
 
@@ -77,7 +117,7 @@ def mock_interview_session():
     session.session_id = "session_test123"
     session.overall_score = 75
     session.status = "completed"
-    session.created_at = datetime.now(timezone.utc)
+    session.created_at = FIXED_NOW
     session.competency_scores = {
         "communication": {"score": 70},
         "problem_solving": {"score": 80},
@@ -101,7 +141,6 @@ def mock_interview_session():
 class TestResolutionManagement:
     """Tests for resolution CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_resolution_with_custom_targets(self, mock_db, mock_user_progress):
         """Resolution should be created with specified target skills."""
         # Setup
@@ -128,82 +167,103 @@ class TestResolutionManagement:
         assert baseline["technical_depth"] == 60
         assert baseline["system_design"] == 50
 
+    async def test_create_resolution_uses_insert_returning(self, mock_db, assert_committed_once):
+        """Resolution should be hydrated from INSERT ... RETURNING without a refresh."""
+        resolution_id = uuid4()
+        created_at = FIXED_NOW
+        mock_db.execute.return_value.one = MagicMock(
+            return_value=MagicMock(_mapping={"id": resolution_id, "created_at": created_at})
+        )
+        service = ProgressService(mock_db)
+
+        with patch.object(service, '_ensure_user_progress_exists', AsyncMock()), \
+                patch.object(service, '_get_current_skill_levels', AsyncMock(return_value={"communication": 50})):
+            resolution = await service.create_resolution("user_test123", "Speak up")
+
+        assert resolution.id == resolution_id
+        assert resolution.created_at == created_at
+        assert resolution.target_skills == {"communication": 60}
+        mock_db.add.assert_not_called()
+        mock_db.refresh.assert_not_called()
+        assert_committed_once(mock_db)
+
+    async def test_update_resolution_skips_commit_when_unchanged(self, mock_db, mock_resolution):
+        """Resending identical values should not commit."""
+        service = ProgressService(mock_db)
+
+        with patch.object(service, 'get_resolution', AsyncMock(return_value=mock_resolution)):
+            result = await service.update_resolution(
+                mock_resolution.id, "user_test123", title="Master System Design", description=None
+            )
+
+        assert result is mock_resolution
+        mock_db.commit.assert_not_called()
+        mock_db.refresh.assert_not_called()
+
+    async def test_update_resolution_commits_changes(self, mock_db, mock_resolution, assert_committed_once):
+        """Changed values should be applied and committed."""
+        service = ProgressService(mock_db)
+
+        with patch.object(service, 'get_resolution', AsyncMock(return_value=mock_resolution)):
+            result = await service.update_resolution(
+                mock_resolution.id, "user_test123", title="Lead a Team"
+            )
+
+        assert result.title == "Lead a Team"
+        assert_committed_once(mock_db)
+
     def test_default_skill_dimensions_defined(self):
         """Ensure default skill dimensions are properly defined."""
         assert len(DEFAULT_SKILL_DIMENSIONS) >= 6
-        assert "technical_depth" in DEFAULT_SKILL_DIMENSIONS
-        assert "communication" in DEFAULT_SKILL_DIMENSIONS
-        assert "problem_solving" in DEFAULT_SKILL_DIMENSIONS
-        assert "system_design" in DEFAULT_SKILL_DIMENSIONS
+        assert _DIMS >= {"technical_depth", "communication", "problem_solving", "system_design"}
 
 
 class TestProgressCalculation:
     """Tests for progress calculation logic."""
 
-    def test_progress_percent_calculation_basic(self):
-        """Progress should be calculated correctly between baseline and target."""
-        baseline = 50
-        current = 65
-        target = 80
-
-        # Formula: (current - baseline) / (target - baseline) * 100
-        expected_progress = (65 - 50) / (80 - 50) * 100
-        assert expected_progress == 50.0  # 50% progress
-
-    def test_progress_percent_at_target(self):
-        """Progress should be 100% when current equals target."""
-        baseline = 50
-        current = 80
-        target = 80
-
-        progress = (current - baseline) / (target - baseline) * 100
-        assert progress == 100.0
-
-    def test_progress_percent_exceeds_target(self):
-        """Progress should be capped at 100% when exceeding target."""
-        baseline = 50
-        current = 90
-        target = 80
-
-        progress = (current - baseline) / (target - baseline) * 100
-        clamped = max(0, min(100, progress))
-        # Should be capped at 100
-        assert clamped == 100
-
-    def test_progress_percent_below_baseline(self):
-        """Progress should be clamped to 0% if current is below baseline."""
-        baseline = 50
-        current = 40  # Below baseline
-        target = 80
-
-        progress = (current - baseline) / (target - baseline) * 100
-        clamped = max(0, min(100, progress))
-        assert clamped == 0  # Negative progress clamped to 0
-
-    def test_progress_with_equal_baseline_and_target(self):
-        """Handle edge case where baseline equals target."""
-        baseline = 80
-        current = 80
-        target = 80
-
-        # When target equals baseline, progress is 100% if current >= target
-        if target > baseline:
-            progress = (current - baseline) / (target - baseline) * 100
-        else:
-            progress = 100 if current >= target else 0
-
-        assert progress == 100
-
-    def test_overall_progress_averaging(self):
+    @staticmethod
+    async def _resolution_progress(service, baseline, current, target):
+        """Run get_resolution_progress for one resolution with stubbed lookups."""
+        resolution = SimpleNamespace(
+            id=uuid4(),
+            title="Level up",
+            status="active",
+            target_date=None,
+            baseline_skills=baseline,
+            target_skills=target,
+        )
+        with patch.object(service, "get_resolution", AsyncMock(return_value=resolution)), \
+                patch.object(service, "_get_current_skill_levels", AsyncMock(return_value=current)):
+            return await service.get_resolution_progress(resolution.id, "user_test123")
+
+    @pytest.mark.parametrize("baseline,current,target,expected", [
+        (50, 65, 80, 50.0),    # halfway between baseline and target
+        (50, 80, 80, 100.0),   # at target
+        (50, 90, 80, 100.0),   # exceeds target, capped at 100
+        (50, 40, 80, 0.0),     # below baseline, clamped to 0
+        (80, 80, 80, 100.0),   # baseline equals target
+    ])
+    async def test_progress_formula(self, readonly_service, baseline, current, target, expected):
+        """Progress is (current - baseline) / (target - baseline) * 100, clamped to 0-100."""
+        result = await self._resolution_progress(
+            readonly_service,
+            {"technical_depth": baseline},
+            {"technical_depth": current},
+            {"technical_depth": target},
+        )
+
+        assert result["skills_progress"]["technical_depth"]["progress_percent"] == expected
+
+    async def test_overall_progress_averaging(self, readonly_service):
         """Overall progress should be average of all skill progress."""
-        skill_progress = {
-            "technical_depth": 60,
-            "communication": 80,
-            "system_design": 40
-        }
+        result = await self._resolution_progress(
+            readonly_service,
+            {"technical_depth": 0, "communication": 0, "system_design": 0},
+            {"technical_depth": 60, "communication": 80, "system_design": 40},
+            {"technical_depth": 100, "communication": 100, "system_design": 100},
+        )
 
-        overall = sum(skill_progress.values()) / len(skill_progress)
-        assert overall == 60.0
+        assert result["overall_progress"] == 60.0
 
 
 # ===== Skill Gap Analysis Tests =====
@@ -211,7 +271,7 @@ class TestProgressCalculation:
 class TestSkillGapAnalysis:
     """Tests for skill gap analysis logic."""
 
-    def test_gap_identification(self):
+    def test_gap_identification(self, readonly_service):
         """Gaps should be identified when current < target by > 15."""
         current_skills = {
             "technical_depth": 60,
@@ -224,18 +284,12 @@ class TestSkillGapAnalysis:
             "system_design": 85     # Gap: 45 (significant)
         }
 
-        gaps = []
-        for skill, target in target_requirements.items():
-            current = current_skills.get(skill, 0)
-            gap = target - current
-            if gap > 15:
-                gaps.append({"skill": skill, "gap": gap})
+        gaps, strengths = readonly_service._classify_skill_gaps(current_skills, target_requirements, {})
 
-        assert len(gaps) == 2
-        assert any(g["skill"] == "technical_depth" for g in gaps)
-        assert any(g["skill"] == "system_design" for g in gaps)
+        assert {g["skill"] for g in gaps} == {"technical_depth", "system_design"}
+        assert strengths == []
 
-    def test_strength_identification(self):
+    def test_strength_identification(self, readonly_service):
         """Strengths should be identified when current > target by > 10."""
         current_skills = {
             "technical_depth": 95,  # Exceeds by 15
@@ -248,15 +302,10 @@ class TestSkillGapAnalysis:
             "system_design": 85
         }
 
-        strengths = []
-        for skill, target in target_requirements.items():
-            current = current_skills.get(skill, 0)
-            gap = target - current
-            if gap < -10:  # Exceeds target
-                strengths.append({"skill": skill, "level": current})
+        gaps, strengths = readonly_service._classify_skill_gaps(current_skills, target_requirements, {})
 
-        assert len(strengths) == 1
-        assert strengths[0]["skill"] == "technical_depth"
+        assert [s["skill"] for s in strengths] == ["technical_depth"]
+        assert strengths[0]["current"] == 95
 
     def test_gaps_sorted_by_severity(self):
         """Gaps should be sorted by severity (largest gap first)."""
@@ -272,44 +321,54 @@ class TestSkillGapAnalysis:
         assert gaps[1]["skill"] == "technical_depth"
         assert gaps[2]["skill"] == "communication"
 
+    async def test_verified_skills_merged_in_database(self, mock_db):
+        """Verified skills should come back as the merged map from a single query."""
+        mock_db.execute.return_value.all = MagicMock(return_value=[
+            ("python", {"depth": 4, "evidence": "built APIs"}),
+            ("react", {"depth": 2}),
+        ])
+        service = ProgressService(mock_db)
+
+        verified = await service._get_verified_skills("user_test123")
+
+        mock_db.execute.assert_awaited_once()
+        assert verified == {
+            "python": {"depth": 4, "evidence": "built APIs"},
+            "react": {"depth": 2},
+        }
+
 
 class TestGapRecommendations:
     """Tests for gap-based recommendations."""
 
-    def test_recommendations_include_top_gap(self):
+    def test_recommendations_include_top_gap(self, readonly_service):
         """Recommendations should mention the top skill gap."""
-        service = ProgressService(AsyncMock())
-
         gaps = [
             {"skill": "system_design", "current": 40, "target": 85, "gap": 45}
         ]
 
-        recommendations = service._generate_gap_recommendations(gaps, [])
+        recommendations = readonly_service._generate_gap_recommendations(gaps, [])
 
         assert len(recommendations) > 0
         assert "system_design" in recommendations[0] or "system design" in recommendations[0]
 
-    def test_recommendations_with_identified_gaps(self):
+    def test_recommendations_with_identified_gaps(self, readonly_service):
         """Recommendations should include areas identified from interviews."""
-        service = ProgressService(AsyncMock())
-
         gaps = []
         identified_gaps = ["distributed_systems", "microservices"]
 
-        recommendations = service._generate_gap_recommendations(gaps, identified_gaps)
+        recommendations = readonly_service._generate_gap_recommendations(gaps, identified_gaps)
 
         # Should mention interview feedback
         has_interview_mention = any("feedback" in r.lower() or "identified" in r.lower() for r in recommendations)
         assert has_interview_mention or len(recommendations) > 0
 
-    def test_recommendations_when_no_gaps(self):
+    def test_recommendations_when_no_gaps(self, readonly_service):
         """Should encourage setting higher goals when no gaps exist."""
-        service = ProgressService(AsyncMock())
-
         gaps = []
         identified_gaps = []
 
-        recommendations = service._generate_gap_recommendations(gaps, identified_gaps)
+        recommendations = readonly_service._generate_gap_recommendations(gaps, identified_gaps)
 
         # Should have encouraging message
         assert len(recommendations) > 0
@@ -320,127 +379,105 @@ class TestGapRecommendations:
 class TestWeeklyInsights:
     """Tests for weekly insights generation."""
 
-    def test_trend_calculation_improving(self):
-        """Trend should be positive when this week > last week."""
-        this_week_avg = 75
-        last_week_avg = 70
-
-        trend = this_week_avg - last_week_avg
-        direction = "up" if trend > 0 else "down" if trend < 0 else "stable"
+    async def test_empty_week_uses_consistent_period(self, mock_db):
+        """Period bounds should derive from a single clock reading."""
+        service = ProgressService(mock_db)
 
-        assert trend == 5
-        assert direction == "up"
+        empty_stats = MagicMock(sessions_count=0, avg_score=None, prev_avg=None)
+        with patch.object(service, '_get_weekly_score_stats', AsyncMock(return_value=empty_stats)), \
+                patch.object(service, '_get_session_summaries', AsyncMock()) as summaries:
+            result = await service.generate_weekly_insights("user_test123")
 
-    def test_trend_calculation_declining(self):
-        """Trend should be negative when this week < last week."""
-        this_week_avg = 65
-        last_week_avg = 70
+        period_start = datetime.fromisoformat(result["period_start"])
+        period_end = datetime.fromisoformat(result["period_end"])
+        assert period_end - period_start == timedelta(days=7)
+        assert result["sessions_count"] == 0
+        summaries.assert_not_called()
 
+    async def test_weekly_stats_drive_trend(self, mock_db):
+        """Averages from the aggregate query should drive score and trend."""
+        service = ProgressService(mock_db)
+        stats = MagicMock(sessions_count=1, avg_score=75, prev_avg=70)
+        row = MagicMock(
+            stage_type="technical",
+            overall_score=75,
+            competency_scores={"communication": {"score": 70}},
+            job_role="Software Engineer"
+        )
+
+        with patch.object(service, '_get_weekly_score_stats', AsyncMock(return_value=stats)), \
+                patch.object(service, '_get_session_summaries', AsyncMock(return_value=[row])), \
+                patch.object(service, '_generate_ai_insights', AsyncMock(return_value={})), \
+                patch.object(service, '_create_weekly_snapshot', AsyncMock()):
+            result = await service.generate_weekly_insights("user_test123")
+
+        assert result["sessions_count"] == 1
+        assert result["average_score"] == 75.0
+        assert result["score_trend"] == 5.0
+        assert result["trend_direction"] == "up"
+        assert result["competencies"] == {"communication": 70.0}
+
+    @pytest.mark.parametrize("this_week_avg,last_week_avg,expected_trend,expected_direction", [
+        (75, 70, 5, "up"),
+        (65, 70, -5, "down"),
+        (70, 70, 0, "stable"),
+    ])
+    def test_trend_calculation(self, this_week_avg, last_week_avg, expected_trend, expected_direction):
+        """Trend is this week minus last week; its sign sets the direction."""
         trend = this_week_avg - last_week_avg
-        direction = "up" if trend > 0 else "down" if trend < 0 else "stable"
 
-        assert trend == -5
-        assert direction == "down"
+        assert trend == expected_trend
+        assert trend_direction(trend) == expected_direction
 
-    def test_trend_calculation_stable(self):
-        """Trend should be stable when scores are equal."""
-        this_week_avg = 70
-        last_week_avg = 70
-
-        trend = this_week_avg - last_week_avg
-        direction = "up" if trend > 0 else "down" if trend < 0 else "stable"
+    def test_trend_direction_without_history(self):
+        """No previous week means a stable trend."""
+        assert trend_direction(None) == "stable"
 
-        assert trend == 0
-        assert direction == "stable"
-
-    def test_competency_aggregation(self):
+    async def test_competency_aggregation(self, readonly_service):
         """Competency scores should be averaged across sessions."""
-        sessions_competencies = [
-            {"communication": {"score": 70}, "problem_solving": {"score": 80}},
-            {"communication": {"score": 80}, "problem_solving": {"score": 70}},
+        sessions = [
+            SimpleNamespace(competency_scores={"communication": {"score": 70}, "problem_solving": {"score": 80}}),
+            SimpleNamespace(competency_scores={"communication": {"score": 80}, "problem_solving": 70}),
+            SimpleNamespace(competency_scores=None),
         ]
 
-        competencies = {}
-        counts = {}
-
-        for session_comp in sessions_competencies:
-            for comp, data in session_comp.items():
-                score = data.get("score", 0)
-                if comp not in competencies:
-                    competencies[comp] = 0
-                    counts[comp] = 0
-                competencies[comp] += score
-                counts[comp] += 1
-
-        averages = {
-            comp: round(total / counts[comp], 1)
-            for comp, total in competencies.items()
-        }
+        averages = await readonly_service._aggregate_competencies(sessions)
 
-        assert averages["communication"] == 75.0
-        assert averages["problem_solving"] == 75.0
+        assert averages == {"communication": 75.0, "problem_solving": 75.0}
 
 
 class TestFallbackInsights:
     """Tests for fallback insights when AI is unavailable."""
 
-    def test_fallback_strengths_identified(self):
+    def test_fallback_strengths_identified(self, readonly_service):
         """Fallback should identify strengths for scores >= 75."""
-        service = ProgressService(AsyncMock())
-
         competencies = {
             "communication": 80,  # Strength
             "problem_solving": 60,  # Not strength
             "system_design": 78   # Strength
         }
 
-        result = service._generate_fallback_insights(75, competencies, None)
+        result = readonly_service._generate_fallback_insights(75, competencies, None)
 
         assert len(result["strengths"]) >= 2
 
-    def test_fallback_areas_to_improve_identified(self):
+    def test_fallback_areas_to_improve_identified(self, readonly_service):
         """Fallback should identify areas to improve for scores < 60."""
-        service = ProgressService(AsyncMock())
-
         competencies = {
             "communication": 55,  # Needs attention
             "problem_solving": 80,
             "system_design": 45   # Needs attention
         }
 
-        result = service._generate_fallback_insights(60, competencies, None)
+        result = readonly_service._generate_fallback_insights(60, competencies, None)
 
         assert len(result["areas_to_improve"]) >= 2
 
-    def test_fallback_highlights_excellent_performance(self):
-        """Fallback should highlight excellent performance for avg >= 80."""
-        service = ProgressService(AsyncMock())
-
-        result = service._generate_fallback_insights(85, {}, None)
-
-        # Should have positive highlight
-        has_excellent = any("excellent" in h.lower() for h in result["highlights"])
-        assert has_excellent
-
-    def test_fallback_highlights_improvement(self):
-        """Fallback should highlight when trend is significantly positive."""
-        service = ProgressService(AsyncMock())
-
-        result = service._generate_fallback_insights(70, {}, 10)  # +10 improvement
-
-        # Should mention improvement
-        has_improvement = any("improvement" in h.lower() or "up" in h.lower() for h in result["highlights"])
-        assert has_improvement
-
-    def test_fallback_recommendation_for_decline(self):
-        """Fallback should recommend review when trend is negative."""
-        service = ProgressService(AsyncMock())
+    def test_fallback_messages(self, fallback_result):
+        """Excellent averages, big improvements and declines should each be called out."""
+        messages, keywords = fallback_result
 
-        result = service._generate_fallback_insights(65, {}, -10)  # -10 decline
-
-        # Should have recommendation about decline
-        has_decline_rec = any("dipped" in r.lower() or "review" in r.lower() for r in result["recommendations"])
-        assert has_decline_rec
+        assert any(keyword in message.lower() for message in messages for keyword in keywords)
 
 
 # ===== Skill Level Mapping Tests =====
@@ -486,56 +523,15 @@ class TestSkillLevelMapping:
 class TestTargetRequirements:
     """Tests for role-based target requirements."""
 
-    def test_senior_role_targets(self):
-        """Senior roles should have higher targets."""
-        role_targets = {
-            "senior": {
-                "technical_depth": 80,
-                "communication": 75,
-                "problem_solving": 80,
-                "system_design": 75,
-                "leadership": 70,
-                "adaptability": 70
-            }
-        }
-
-        # Senior targets should all be >= 70
-        for skill, target in role_targets["senior"].items():
-            assert target >= 70
-
-    def test_mid_role_targets(self):
-        """Mid-level roles should have moderate targets."""
-        role_targets = {
-            "mid": {
-                "technical_depth": 70,
-                "communication": 65,
-                "problem_solving": 70,
-                "system_design": 60,
-                "leadership": 55,
-                "adaptability": 65
-            }
-        }
-
-        # Mid targets should be between 55-70
-        for skill, target in role_targets["mid"].items():
-            assert 55 <= target <= 70
-
-    def test_default_role_targets(self):
-        """Default targets should be balanced for entry-level."""
-        role_targets = {
-            "default": {
-                "technical_depth": 60,
-                "communication": 60,
-                "problem_solving": 60,
-                "system_design": 50,
-                "leadership": 50,
-                "adaptability": 60
-            }
-        }
-
-        # Default targets should be around 50-60
-        for skill, target in role_targets["default"].items():
-            assert 50 <= target <= 60
+    @pytest.mark.parametrize("role,lo,hi", [
+        ("senior", 70, 100),   # Senior roles should have higher targets
+        ("mid", 55, 70),       # Mid-level roles should have moderate targets
+        ("default", 50, 60),   # Default targets balanced for entry-level
+    ])
+    def test_role_targets_in_range(self, role, lo, hi):
+        """Each role's targets should fall in its expected band."""
+        for target in ROLE_TARGETS[role].values():
+            assert lo <= target <= hi
 
 
 # ===== Days Remaining Tests =====
@@ -543,24 +539,21 @@ class TestTargetRequirements:
 class TestDaysRemaining:
     """Tests for target date calculations."""
 
-    def test_days_remaining_positive(self):
+    def test_days_remaining_positive(self, frozen_now):
         """Days remaining should be positive for future dates."""
-        target_date = datetime.now(timezone.utc) + timedelta(days=100)
-        now = datetime.now(timezone.utc)
+        target_date = frozen_now + timedelta(days=100)
 
-        days_remaining = (target_date - now).days
+        days_remaining = (target_date - frozen_now).days
 
-        assert days_remaining > 0
-        assert days_remaining <= 100
+        assert days_remaining == 100
 
-    def test_days_remaining_past_date(self):
+    def test_days_remaining_past_date(self, frozen_now):
         """Days remaining should be negative for past dates."""
-        target_date = datetime.now(timezone.utc) - timedelta(days=10)
-        now = datetime.now(timezone.utc)
+        target_date = frozen_now - timedelta(days=10)
 
-        days_remaining = (target_date - now).days
+        days_remaining = (target_date - frozen_now).days
 
-        assert days_remaining < 0
+        assert days_remaining == -10
 
 
 if __name__ == "__main__":
@@ -1,29 +1,51 @@
 
+import functools
+
 import pytest
 from app.services.core.intelligence.prompt_manager import prompt_manager
 
+
+# Memoized so repeated/parametrized inputs render and scan only once
+@functools.lru_cache(maxsize=32)
+def _cached_instruction(stage_type, job_role, resume_text="", job_description="", context_info="", language="en"):
+    return prompt_manager.get_system_instruction(
+        stage_type=stage_type,
+        job_role=job_role,
+        resume_text=resume_text,
+        job_description=job_description,
+        context_info=context_info,
+        language=language
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _detect(text):
+    """Cached tech detection; a tuple so callers cannot mutate the cached result."""
+    return tuple(prompt_manager._detect_tech_stack(text))
+
+
 class TestTechStackInjection:
     
     def test_tech_detection_python(self):
         """Verify python keywords are detected."""
         text = "I am a Senior Python Developer with Django experience."
-        detected = prompt_manager._detect_tech_stack(text)
+        detected = _detect(text)
         assert "python" in detected
         assert len(detected) >= 1
 
     def test_tech_detection_react(self):
         """Verify react keywords are detected."""
         text = "Frontend Engineer specialized in React and Next.js"
-        detected = prompt_manager._detect_tech_stack(text)
+        detected = _detect(text)
         assert "react" in detected
         text2 = "Next.js Specialist"
-        detected2 = prompt_manager._detect_tech_stack(text2)
+        detected2 = _detect(text2)
         assert "react" in detected2
 
     def test_tech_detection_multiple(self):
         """Verify multiple stacks are detected."""
         text = "Fullstack with Python, React, and AWS."
-        detected = prompt_manager._detect_tech_stack(text)
+        detected = _detect(text)
         assert "python" in detected
         assert "react" in detected
         assert "aws" in detected
@@ -31,19 +53,14 @@ class TestTechStackInjection:
     def test_tech_detection_none(self):
         """Verify no false positives."""
         text = "I am a Manager."
-        detected = prompt_manager._detect_tech_stack(text)
-        assert detected == []
+        detected = _detect(text)
+        assert detected == ()
 
     def test_system_prompt_integration(self):
         """Verify detection is actually injected into the prompt text."""
         # Switched to Python to ensure we are testing the Template Logic, 
         # not the tricky 'Go' regex which failed on boundary checks.
-        instruction = prompt_manager.get_system_instruction(
-            stage_type="technical",
-            job_role="Senior Python Developer",
-            context_info="",
-            language="en"
-        )
+        instruction = _cached_instruction("technical", "Senior Python Developer", "", "", "", "en")
         
         # Check for Section Header
         assert "TECHNICAL DEEP DIVE" in instruction
@@ -56,12 +73,7 @@ class TestTechStackInjection:
     def test_system_prompt_none_inputs(self):
         """Verify that None inputs for resume/jd do not crash the system (Regression Test)."""
         try:
-            instruction = prompt_manager.get_system_instruction(
-                stage_type="technical",
-                job_role="Python Dev",
-                resume_text=None,
-                job_description=None
-            )
+            instruction = _cached_instruction("technical", "Python Dev", None, None)
             assert "TECHNICAL DEEP DIVE" in instruction
             # Should fall back to safe empty strings, so has_resume/has_jd should be False
             # meaning no RESUME AUTOPSY or GAP ANALYSIS sections
@@ -1,47 +1,89 @@
-"""
+"""PYTEST_DONT_REWRITE
 Tests for repositories - Using mocked database sessions.
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.application_repo import ApplicationRepository
 from app.repositories.session_repo import SessionRepository
-from app.models.interview import InterviewApplication, InterviewSession
 
 
 # ===== Fixtures =====
-
-@pytest.fixture
-def mock_db():
-    """Create a mock async database session."""
-    db = AsyncMock(spec=AsyncSession)
+# The spec'd session mock is expensive to build, so it is created once per
+# module and reset before every test. Models only need attribute access,
+# so they are plain namespaces built fresh per test.
+
+APPLICATION_ATTRS = {
+    "id": "test-app-id",
+    "user_id": "user-123",
+    "job_role": "Software Engineer",
+    "status": "in_progress",
+    "current_stage": 1,
+}
+
+SESSION_ATTRS = {
+    "id": 1,
+    "session_id": "session-abc",
+    "user_id": "user-123",
+    "job_role": "Software Engineer",
+    "status": "pending",
+    "stage_type": "hr",
+}
+
+
+@pytest.fixture(scope="module")
+def db_result():
+    """Shared result object returned by mock_db.execute."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def mock_db(db_result):
+    """
+    Create a mock async database session.
+
+    The spec keeps commit/refresh awaitable; execute is a plain recording
+    mock whose side effect is a bare coroutine returning db_result.
+    """
+    async def _execute(*args, **kwargs):
+        return db_result
+
+    db = MagicMock(spec=AsyncSession)
+    db.execute = MagicMock(side_effect=_execute)
     return db
 
 
+@pytest.fixture(autouse=True)
+def _reset_db(mock_db, db_result):
+    """Give every test a clean session mock; execute keeps its side effect."""
+    mock_db.reset_mock(return_value=True)
+    db_result.reset_mock()
+
+
 @pytest.fixture
 def mock_application():
-    """Create a mock InterviewApplication."""
-    app = MagicMock(spec=InterviewApplication)
-    app.id = "test-app-id"
-    app.user_id = "user-123"
-    app.job_role = "Software Engineer"
-    app.status = "in_progress"
-    app.current_stage = 1
-    return app
+    """Create a stand-in InterviewApplication."""
+    return SimpleNamespace(**APPLICATION_ATTRS)
 
 
 @pytest.fixture
 def mock_session():
-    """Create a mock InterviewSession."""
-    session = MagicMock(spec=InterviewSession)
-    session.id = 1
-    session.session_id = "session-abc"
-    session.user_id = "user-123"
-    session.job_role = "Software Engineer"
-    session.status = "pending"
-    session.stage_type = "hr"
-    return session
+    """Create a stand-in InterviewSession."""
+    return SimpleNamespace(**SESSION_ATTRS)
+
+
+@pytest.fixture(scope="module")
+def app_repo(mock_db):
+    """ApplicationRepository over the shared mock session."""
+    return ApplicationRepository(mock_db)
+
+
+@pytest.fixture(scope="module")
+def session_repo(mock_db):
+    """SessionRepository over the shared mock session."""
+    return SessionRepository(mock_db)
 
 
 # ===== ApplicationRepository Tests =====
@@ -49,72 +91,42 @@ def mock_session():
 class TestApplicationRepositoryGetById:
     """Tests for ApplicationRepository.get_by_id."""
     
-    @pytest.mark.asyncio
-    async def test_returns_application_when_found(self, mock_db, mock_application):
-        """Should return application when found."""
-        # Setup mock
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_application
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize("found", [True, False], ids=["found", "not_found"])
+    async def test_get_by_id(self, app_repo, db_result, mock_db, mock_application, found):
+        """Should return the application when found, None otherwise."""
+        db_result.scalar_one_or_none.return_value = mock_application if found else None
         
-        repo = ApplicationRepository(mock_db)
-        result = await repo.get_by_id("test-app-id")
+        result = await app_repo.get_by_id("test-app-id" if found else "nonexistent-id")
         
-        assert result is not None
-        assert result.id == "test-app-id"
+        if found:
+            assert result.id == "test-app-id"
+        else:
+            assert result is None
         mock_db.execute.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, mock_db):
-        """Should return None when application not found."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-        
-        repo = ApplicationRepository(mock_db)
-        result = await repo.get_by_id("nonexistent-id")
-        
-        assert result is None
 
 
 class TestApplicationRepositoryGetByIdAndUser:
     """Tests for ApplicationRepository.get_by_id_and_user."""
     
-    @pytest.mark.asyncio
-    async def test_returns_application_for_valid_user(self, mock_db, mock_application):
-        """Should return application when user matches."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_application
-        mock_db.execute.return_value = mock_result
-        
-        repo = ApplicationRepository(mock_db)
-        result = await repo.get_by_id_and_user("test-app-id", "user-123")
-        
-        assert result is not None
-        assert result.user_id == "user-123"
-    
-    @pytest.mark.asyncio
-    async def test_returns_none_for_wrong_user(self, mock_db):
-        """Should return None when user doesn't match."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize("user_id,found", [("user-123", True), ("wrong-user", False)])
+    async def test_get_by_id_and_user(self, app_repo, db_result, mock_db, mock_application, user_id, found):
+        """Should return the application only when the user matches."""
+        db_result.scalar_one_or_none.return_value = mock_application if found else None
         
-        repo = ApplicationRepository(mock_db)
-        result = await repo.get_by_id_and_user("test-app-id", "wrong-user")
+        result = await app_repo.get_by_id_and_user("test-app-id", user_id)
         
-        assert result is None
+        if found:
+            assert result.user_id == "user-123"
+        else:
+            assert result is None
 
 
 class TestApplicationRepositoryCreate:
     """Tests for ApplicationRepository.create."""
     
-    @pytest.mark.asyncio
-    async def test_creates_application_with_defaults(self, mock_db):
+    async def test_creates_application_with_defaults(self, app_repo, mock_db, assert_committed_once):
         """Should create application with default status and stage."""
-        repo = ApplicationRepository(mock_db)
-        
-        await repo.create(
+        await app_repo.create(
             application_id="new-app-id",
             user_id="user-123",
             job_role="Developer"
@@ -122,7 +134,7 @@ class TestApplicationRepositoryCreate:
         
         # Verify db.add was called
         mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        assert_committed_once(mock_db)
         mock_db.refresh.assert_called_once()
         
         # Verify the object passed to add
@@ -134,22 +146,16 @@ class TestApplicationRepositoryCreate:
 class TestApplicationRepositoryUpdateStage:
     """Tests for ApplicationRepository.update_stage."""
     
-    @pytest.mark.asyncio
-    async def test_updates_stage_number(self, mock_db, mock_application):
+    async def test_updates_stage_number(self, app_repo, mock_db, mock_application, assert_committed_once):
         """Should update stage number."""
-        repo = ApplicationRepository(mock_db)
-        
-        await repo.update_stage(mock_application, new_stage=2)
+        await app_repo.update_stage(mock_application, new_stage=2)
         
         assert mock_application.current_stage == 2
-        mock_db.commit.assert_called_once()
+        assert_committed_once(mock_db)
     
-    @pytest.mark.asyncio
-    async def test_updates_status_when_provided(self, mock_db, mock_application):
+    async def test_updates_status_when_provided(self, app_repo, mock_db, mock_application):
         """Should update status when provided."""
-        repo = ApplicationRepository(mock_db)
-        
-        await repo.update_stage(mock_application, new_stage=3, status="completed")
+        await app_repo.update_stage(mock_application, new_stage=3, status="completed")
         
         assert mock_application.current_stage == 3
         assert mock_application.status == "completed"
@@ -160,41 +166,25 @@ class TestApplicationRepositoryUpdateStage:
 class TestSessionRepositoryGetBySessionId:
     """Tests for SessionRepository.get_by_session_id."""
     
-    @pytest.mark.asyncio
-    async def test_returns_session_when_found(self, mock_db, mock_session):
-        """Should return session when found."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_session
-        mock_db.execute.return_value = mock_result
-        
-        repo = SessionRepository(mock_db)
-        result = await repo.get_by_session_id("session-abc")
+    @pytest.mark.parametrize("found", [True, False], ids=["found", "not_found"])
+    async def test_get_by_session_id(self, session_repo, db_result, mock_db, mock_session, found):
+        """Should return the session when found, None otherwise."""
+        db_result.scalar_one_or_none.return_value = mock_session if found else None
         
-        assert result is not None
-        assert result.session_id == "session-abc"
-    
-    @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, mock_db):
-        """Should return None when session not found."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        result = await session_repo.get_by_session_id("session-abc" if found else "nonexistent")
         
-        repo = SessionRepository(mock_db)
-        result = await repo.get_by_session_id("nonexistent")
-        
-        assert result is None
+        if found:
+            assert result.session_id == "session-abc"
+        else:
+            assert result is None
 
 
 class TestSessionRepositoryCreate:
     """Tests for SessionRepository.create."""
     
-    @pytest.mark.asyncio
-    async def test_creates_session_with_stage_type(self, mock_db):
+    async def test_creates_session_with_stage_type(self, session_repo, mock_db):
         """Should create session with stage_type."""
-        repo = SessionRepository(mock_db)
-        
-        await repo.create(
+        await session_repo.create(
             session_id="new-session",
             user_id="user-123",
             job_role="Developer",
@@ -210,48 +200,29 @@ class TestSessionRepositoryCreate:
 class TestSessionRepositoryUpdateTranscript:
     """Tests for SessionRepository.update_transcript."""
     
-    @pytest.mark.asyncio
-    async def test_updates_transcript_and_returns_true(self, mock_db):
-        """Should update transcript and return True."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 1
-        mock_db.execute.return_value = mock_result
-        
-        repo = SessionRepository(mock_db)
-        result = await repo.update_transcript("session-abc", '{"messages":[]}')
-        
-        assert result is True
-        mock_db.commit.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_returns_false_when_not_found(self, mock_db):
-        """Should return False when session not found."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 0
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize("rowcount,expected", [(1, True), (0, False)], ids=["updated", "not_found"])
+    async def test_update_transcript(self, session_repo, db_result, mock_db, rowcount, expected, assert_committed_once):
+        """Should return whether a session row was updated, committing either way."""
+        db_result.rowcount = rowcount
         
-        repo = SessionRepository(mock_db)
-        result = await repo.update_transcript("nonexistent", '{}')
+        result = await session_repo.update_transcript("session-abc", '{"messages":[]}')
         
-        assert result is False
+        assert result is expected
+        assert_committed_once(mock_db)
 
 
 class TestSessionRepositoryUpdateFeedback:
     """Tests for SessionRepository.update_feedback."""
     
-    @pytest.mark.asyncio
-    async def test_updates_feedback_and_score(self, mock_db):
+    async def test_updates_feedback_and_score(self, session_repo, db_result, mock_db, assert_committed_once):
         """Should update feedback and overall score."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 1
-        mock_db.execute.return_value = mock_result
+        db_result.rowcount = 1
         
-        repo = SessionRepository(mock_db)
-        result = await repo.update_feedback(
+        result = await session_repo.update_feedback(
             "session-abc",
             "Great interview!",
             overall_score=85
         )
         
         assert result is True
-        mock_db.commit.assert_called_once()
+        assert_committed_once(mock_db)
@@ -0,0 +1,59 @@
+"""
+Tests for database seeders - Session and transaction handling.
+"""
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.seeders.badge_seeder import BADGES, UPSERT_SQL, BadgeSeeder
+
+
+BADGE_IDS = [b["id"] for b in BADGES]
+
+
+async def _existing_badge_ids(db: AsyncSession) -> set:
+    result = await db.execute(
+        text("SELECT id FROM achievements WHERE id = ANY(:ids)"),
+        {"ids": BADGE_IDS}
+    )
+    return set(result.scalars().all())
+
+
+class TestBadgeSeeder:
+    """Tests for BadgeSeeder.run."""
+
+    async def test_upserts_through_the_session(self):
+        """Should send every badge in one session execute, never a raw driver call."""
+        mock_db = MagicMock(spec=AsyncSession)
+
+        count = await BadgeSeeder().run(mock_db)
+
+        assert count == len(BADGES)
+        mock_db.execute.assert_awaited_once()
+        statement, rows = mock_db.execute.await_args.args
+        assert statement is UPSERT_SQL
+        assert [row["id"] for row in rows] == BADGE_IDS
+        mock_db.connection.assert_not_called()
+
+
+@pytest.mark.integration
+class TestBadgeSeederIntegration:
+    """Badge seeding against the real database"""
+
+    async def test_rollback_discards_badges(self):
+        """A rollback after run() should leave no new badge rows behind"""
+        from app.services.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as observer:
+            before = await _existing_badge_ids(observer)
+
+        async with AsyncSessionLocal() as db:
+            await BadgeSeeder().run(db)
+            # Uncommitted rows must not be visible to another connection
+            async with AsyncSessionLocal() as observer:
+                assert await _existing_badge_ids(observer) == before
+            await db.rollback()
+
+        async with AsyncSessionLocal() as observer:
+            assert await _existing_badge_ids(observer) == before
@@ -1,38 +1,65 @@
-"""
+"""PYTEST_DONT_REWRITE
 Tests for services - Business logic layer.
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec, patch
 
+from app.repositories.application_repo import ApplicationRepository
+from app.repositories.session_repo import SessionRepository
 from app.services.application_service import ApplicationService
 from app.services.interview_service import InterviewService
 from app.services.core.exceptions import ApplicationNotFoundError, ApplicationNotInProgressError
 
 
 # ===== Fixtures =====
+# Repository mocks are created once per module and reset before every test;
+# the application only needs attribute access, so it is a fresh namespace.
 
-@pytest.fixture
+APPLICATION_ATTRS = {
+    "id": "app-123",
+    "user_id": "user-123",
+    "job_role": "Developer",
+    "status": "in_progress",
+    "current_stage": 1,
+}
+
+
+@pytest.fixture(scope="module")
 def mock_app_repo():
-    """Create a mock ApplicationRepository."""
-    return AsyncMock()
+    """Create an autospecced ApplicationRepository (introspected once per module)."""
+    return create_autospec(ApplicationRepository, instance=True, spec_set=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_session_repo():
-    """Create a mock SessionRepository."""
-    return AsyncMock()
+    """Create an autospecced SessionRepository (introspected once per module)."""
+    return create_autospec(SessionRepository, instance=True, spec_set=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_repos(mock_app_repo, mock_session_repo):
+    """Give every test clean module-scoped repository mocks."""
+    for repo in (mock_app_repo, mock_session_repo):
+        repo.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
 def mock_application():
-    """Create a mock application object."""
-    app = MagicMock()
-    app.id = "app-123"
-    app.user_id = "user-123"
-    app.job_role = "Developer"
-    app.status = "in_progress"
-    app.current_stage = 1
-    return app
+    """Create a stand-in application object."""
+    return SimpleNamespace(**APPLICATION_ATTRS)
+
+
+@pytest.fixture(scope="module")
+def app_service(mock_app_repo):
+    """ApplicationService over the shared mock repository."""
+    return ApplicationService(mock_app_repo)
+
+
+@pytest.fixture(scope="module")
+def interview_service(mock_session_repo):
+    """InterviewService over the shared mock repository."""
+    return InterviewService(mock_session_repo)
 
 
 # ===== ApplicationService Tests =====
@@ -40,13 +67,11 @@ def mock_application():
 class TestApplicationServiceCreateApplication:
     """Tests for ApplicationService.create_application."""
     
-    @pytest.mark.asyncio
-    async def test_creates_application_with_uuid(self, mock_app_repo):
+    async def test_creates_application_with_uuid(self, app_service, mock_app_repo):
         """Should create application with generated UUID."""
         mock_app_repo.create.return_value = MagicMock(id="generated-uuid")
         
-        service = ApplicationService(mock_app_repo)
-        result = await service.create_application(
+        result = await app_service.create_application(
             user_id="user-123",
             job_role="Developer"
         )
@@ -60,102 +85,82 @@ class TestApplicationServiceCreateApplication:
 class TestApplicationServiceGetApplication:
     """Tests for ApplicationService.get_application."""
     
-    @pytest.mark.asyncio
-    async def test_returns_application_when_found(self, mock_app_repo, mock_application):
+    async def test_returns_application_when_found(self, app_service, mock_app_repo, mock_application):
         """Should return application when found."""
         mock_app_repo.get_by_id_and_user.return_value = mock_application
         
-        service = ApplicationService(mock_app_repo)
-        result = await service.get_application("app-123", "user-123")
+        result = await app_service.get_application("app-123", "user-123")
         
         assert result.id == "app-123"
     
-    @pytest.mark.asyncio
-    async def test_raises_not_found_when_missing(self, mock_app_repo):
+    async def test_raises_not_found_when_missing(self, app_service, mock_app_repo):
         """Should raise ApplicationNotFoundError when not found."""
         mock_app_repo.get_by_id_and_user.return_value = None
         
-        service = ApplicationService(mock_app_repo)
-        
         with pytest.raises(ApplicationNotFoundError):
-            await service.get_application("nonexistent", "user-123")
+            await app_service.get_application("nonexistent", "user-123")
 
 
 class TestApplicationServiceStartStage:
     """Tests for ApplicationService.start_stage."""
     
-    @pytest.mark.asyncio
-    async def test_returns_app_and_stage_type(self, mock_app_repo, mock_application):
+    async def test_returns_app_and_stage_type(self, app_service, mock_app_repo, mock_application):
         """Should return application and correct stage type."""
         mock_app_repo.get_by_id_and_user.return_value = mock_application
         
-        service = ApplicationService(mock_app_repo)
-        app, stage_type = await service.start_stage("app-123", "user-123")
+        app, stage_type = await app_service.start_stage("app-123", "user-123")
         
         assert app.id == "app-123"
         assert stage_type == "hr"  # Stage 1 = HR
     
-    @pytest.mark.asyncio
-    async def test_raises_not_found_when_missing(self, mock_app_repo):
+    async def test_raises_not_found_when_missing(self, app_service, mock_app_repo):
         """Should raise ApplicationNotFoundError when app not found."""
         mock_app_repo.get_by_id_and_user.return_value = None
         
-        service = ApplicationService(mock_app_repo)
-        
         with pytest.raises(ApplicationNotFoundError):
-            await service.start_stage("nonexistent", "user-123")
+            await app_service.start_stage("nonexistent", "user-123")
     
-    @pytest.mark.asyncio
-    async def test_raises_not_in_progress(self, mock_app_repo, mock_application):
+    async def test_raises_not_in_progress(self, app_service, mock_app_repo, mock_application):
         """Should raise ApplicationNotInProgressError when status is not in_progress."""
         mock_application.status = "completed"
         mock_app_repo.get_by_id_and_user.return_value = mock_application
         
-        service = ApplicationService(mock_app_repo)
-        
         with pytest.raises(ApplicationNotInProgressError):
-            await service.start_stage("app-123", "user-123")
+            await app_service.start_stage("app-123", "user-123")
 
 
 class TestApplicationServiceAdvanceStage:
     """Tests for ApplicationService.advance_stage."""
     
-    @pytest.mark.asyncio
-    async def test_increments_stage_from_1_to_2(self, mock_app_repo, mock_application):
+    async def test_increments_stage_from_1_to_2(self, app_service, mock_app_repo, mock_application):
         """Should increment stage from 1 to 2."""
         mock_application.current_stage = 1
         mock_app_repo.get_by_id.return_value = mock_application
         mock_app_repo.update_stage.return_value = mock_application
         
-        service = ApplicationService(mock_app_repo)
-        await service.advance_stage("app-123")
+        await app_service.advance_stage("app-123")
         
         mock_app_repo.update_stage.assert_called_once()
         call_args = mock_app_repo.update_stage.call_args
         assert call_args.args[1] == 2  # new_stage
     
-    @pytest.mark.asyncio
-    async def test_completes_at_stage_3(self, mock_app_repo, mock_application):
+    async def test_completes_at_stage_3(self, app_service, mock_app_repo, mock_application):
         """Should set status to completed at stage 3."""
         mock_application.current_stage = 3
         mock_app_repo.get_by_id.return_value = mock_application
         mock_app_repo.update_stage.return_value = mock_application
         
-        service = ApplicationService(mock_app_repo)
-        await service.advance_stage("app-123")
+        await app_service.advance_stage("app-123")
         
         call_args = mock_app_repo.update_stage.call_args
         assert call_args.kwargs.get("status") == "completed"
     
-    @pytest.mark.asyncio
-    async def test_raises_not_found(self, mock_app_repo):
+    async def test_raises_not_found(self, app_service, mock_app_repo):
         """Should raise ApplicationNotFoundError when not found."""
         mock_app_repo.get_by_id.return_value = None
         
-        service = ApplicationService(mock_app_repo)
-        
         with pytest.raises(ApplicationNotFoundError):
-            await service.advance_stage("nonexistent")
+            await app_service.advance_stage("nonexistent")
 
 
 # ===== InterviewService Tests =====
@@ -163,13 +168,11 @@ class TestApplicationServiceAdvanceStage:
 class TestInterviewServiceCreateSession:
     """Tests for InterviewService.create_session."""
     
-    @pytest.mark.asyncio
-    async def test_creates_session_with_stage_type(self, mock_session_repo):
+    async def test_creates_session_with_stage_type(self, interview_service, mock_session_repo):
         """Should create session with stage_type."""
         mock_session_repo.create.return_value = MagicMock(session_id="session-xyz")
         
-        service = InterviewService(mock_session_repo)
-        result = await service.create_session(
+        result = await interview_service.create_session(
             resume_text="Python developer",
             job_role="Developer",
             stage_type="technical"
@@ -179,13 +182,11 @@ class TestInterviewServiceCreateSession:
         call_args = mock_session_repo.create.call_args
         assert call_args.kwargs["stage_type"] == "technical"
     
-    @pytest.mark.asyncio
-    async def test_generates_session_id(self, mock_session_repo):
+    async def test_generates_session_id(self, interview_service, mock_session_repo):
         """Should generate session_id starting with 'session_'."""
         mock_session_repo.create.return_value = MagicMock()
         
-        service = InterviewService(mock_session_repo)
-        await service.create_session(
+        await interview_service.create_session(
             resume_text="Resume",
             job_role="Developer"
         )
@@ -197,24 +198,20 @@ class TestInterviewServiceCreateSession:
 class TestInterviewServiceGetSession:
     """Tests for InterviewService.get_session."""
     
-    @pytest.mark.asyncio
-    async def test_returns_session_when_found(self, mock_session_repo):
+    async def test_returns_session_when_found(self, interview_service, mock_session_repo):
         """Should return session when found."""
         mock_session = MagicMock(session_id="session-abc")
         mock_session_repo.get_by_session_id.return_value = mock_session
         
-        service = InterviewService(mock_session_repo)
-        result = await service.get_session("session-abc")
+        result = await interview_service.get_session("session-abc")
         
         assert result.session_id == "session-abc"
     
-    @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, mock_session_repo):
+    async def test_returns_none_when_not_found(self, interview_service, mock_session_repo):
         """Should return None when session not found."""
         mock_session_repo.get_by_session_id.return_value = None
         
-        service = InterviewService(mock_session_repo)
-        result = await service.get_session("nonexistent")
+        result = await interview_service.get_session("nonexistent")
         
         assert result is None
 
@@ -222,13 +219,11 @@ class TestInterviewServiceGetSession:
 class TestInterviewServiceUpdateFeedback:
     """Tests for InterviewService.update_feedback."""
     
-    @pytest.mark.asyncio
-    async def test_updates_feedback_successfully(self, mock_session_repo):
+    async def test_updates_feedback_successfully(self, interview_service, mock_session_repo):
         """Should update feedback and return True."""
         mock_session_repo.update_feedback.return_value = True
         
-        service = InterviewService(mock_session_repo)
-        result = await service.update_feedback(
+        result = await interview_service.update_feedback(
             "session-abc",
             "Great job!",
             overall_score=90
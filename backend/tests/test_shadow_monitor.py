@@ -1,20 +1,40 @@
+"""PYTEST_DONT_REWRITE
+Tests for ShadowMonitor - Mocked Gemini client.
+"""
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
-import sys
-import os
+import functools
 import json
-
-# Ensure backend is in path
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from types import MappingProxyType, SimpleNamespace
 
 from app.services.core.intelligence.shadow_monitor import ShadowMonitor
 
-# Mock Response Object
-class MockGeminiResponse:
-    def __init__(self, text_content):
-        self.text = text_content
-
-@pytest.fixture
+# Canned model payloads, serialized once
+_STUCK_JSON = json.dumps({"status": "stuck", "intervention": "Give a hint."})
+# JSON 'null' parses to Python None
+_FLOWING_JSON = json.dumps({"status": "flowing", "intervention": None})
+
+# Canonical transcripts; read-only messages, copied into a list per test
+def _msg(role, content):
+    return MappingProxyType({"role": role, "content": content})
+
+_HISTORY_STUCK = (
+    _msg("assistant", "Question 1"),
+    _msg("user", "Answer 1"),
+    _msg("assistant", "Hard Question"),
+    _msg("user", "I don't know..."),
+)
+_HISTORY_FLOWING = (_msg("assistant", "Q"), _msg("user", "Perfect Answer")) * 2
+_HISTORY_SHORT = (_msg("user", "Hi"),)  # Only 1 message
+_HISTORY_ERROR = (_msg("user", "..."),) * 3
+
+@functools.lru_cache(maxsize=None)
+def _response(payload):
+    # Responses are read-only, so one per payload is shared across tests
+    # ShadowMonitor only reads .text
+    return SimpleNamespace(text=payload)
+
+@pytest.fixture(scope="module")
 def mock_settings():
     # app.services.core/intelligence/shadow_monitor.py uses 'config.settings.get_settings'
     # Wait, the import in shadow_monitor.py is: from config.settings import get_settings
@@ -23,93 +43,42 @@ def mock_settings():
         mock.return_value.SHADOW_MODEL = "models/gemini-mock"
         yield mock
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def shadow_monitor(mock_settings):
-    # Mock OS environ to pass API Key check
-    with patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"}):
-        # Mock genai.Client
-        with patch("google.genai.Client") as mock_client_cls:
-            monitor = ShadowMonitor()
-            
-            # Setup AsyncMock for aio.models.generate_content
-            mock_client_instance = mock_client_cls.return_value
-            mock_client_instance.aio.models.generate_content = AsyncMock()
-            
-            # Since ShadowMonitor stores self.client, we can verify calls on the mock instance
-            yield monitor
-
-@pytest.mark.asyncio
-async def test_analyze_stuck_candidate(shadow_monitor):
-    # Arrange
-    history = [
-        {"role": "assistant", "content": "Question 1"},
-        {"role": "user", "content": "Answer 1"},
-        {"role": "assistant", "content": "Hard Question"},
-        {"role": "user", "content": "I don't know..."}
-    ]
-    
-    expected_response = {
-        "status": "stuck",
-        "intervention": "Give a hint."
-    }
-    
-    shadow_monitor.client.aio.models.generate_content.return_value = MockGeminiResponse(
-        json.dumps(expected_response)
-    )
-
-    # Act
-    intervention = await shadow_monitor.analyze(history, "Dev", "tech")
-
-    # Assert
-    assert intervention == "Give a hint."
-    shadow_monitor.client.aio.models.generate_content.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_analyze_good_flow(shadow_monitor):
-    # Arrange
-    history = [
-        {"role": "assistant", "content": "Q"},
-        {"role": "user", "content": "Perfect Answer"}
-    ] * 2
-    
-    expected_response = {
-        "status": "flowing",
-        "intervention": "null" # or actually None in JSON usually implies key missing or explicit null
-    }
-    # JSON 'null' parses to Python None
-    
-    shadow_monitor.client.aio.models.generate_content.return_value = MockGeminiResponse(
-        json.dumps({"status": "flowing", "intervention": None})
-    )
-
-    # Act
-    intervention = await shadow_monitor.analyze(history, "Dev", "tech")
-
-    # Assert
-    assert intervention is None
-
-@pytest.mark.asyncio
-async def test_short_context_ignored(shadow_monitor):
-    # Arrange
-    history = [{"role": "user", "content": "Hi"}] # Only 1 message
-
-    # Act
-    intervention = await shadow_monitor.analyze(history, "Dev", "tech")
-
-    # Assert
-    assert intervention is None
-    shadow_monitor.client.aio.models.generate_content.assert_not_called()
-
-@pytest.mark.asyncio
-async def test_api_error_handling(shadow_monitor):
-    # Arrange
-    history = [{"role": "user", "content": "..."}] * 3
-    
-    # Simulate Exception
-    shadow_monitor.client.aio.models.generate_content.side_effect = Exception("API Down")
-
-    # Act
-    intervention = await shadow_monitor.analyze(history, "Dev", "tech")
-
-    # Assert
-    assert intervention is None
+    # Prebuilt client; ShadowMonitor stores it as self.client, so calls can be verified on it
+    mock_client_instance = MagicMock()
+    mock_client_instance.aio.models.generate_content = AsyncMock()
+
+    # Patch environ and genai.Client once for the whole module
+    with pytest.MonkeyPatch.context() as mp:
+        # Fake API key to pass the key check
+        mp.setenv("GOOGLE_API_KEY", "fake-key")
+        mp.setattr("google.genai.Client", MagicMock(return_value=mock_client_instance))
+        yield ShadowMonitor()
+
+@pytest.fixture(autouse=True)
+def _reset_generate_content(shadow_monitor):
+    # The monitor is shared, so clear calls/responses left by the previous test
+    shadow_monitor.client.aio.models.generate_content.reset_mock(return_value=True, side_effect=True)
+
+@pytest.mark.parametrize(
+    "history,response,error,expected,expect_call",
+    [
+        (_HISTORY_STUCK, _STUCK_JSON, None, "Give a hint.", True),
+        (_HISTORY_FLOWING, _FLOWING_JSON, None, None, True),
+        (_HISTORY_SHORT, None, None, None, False),
+        (_HISTORY_ERROR, None, Exception("API Down"), None, True),
+    ],
+    ids=["stuck_candidate", "good_flow", "short_context_ignored", "api_error"],
+)
+async def test_analyze(shadow_monitor, history, response, error, expected, expect_call):
+    generate_content = shadow_monitor.client.aio.models.generate_content
+    if response is not None:
+        generate_content.return_value = _response(response)
+    # Simulate API failure
+    generate_content.side_effect = error
+
+    intervention = await shadow_monitor.analyze(list(history), "Dev", "tech")
+
+    assert intervention == expected
+    assert generate_content.call_count == int(expect_call)